@@ -1,10 +1,14 @@
-import PyPDF2
 import re
+import json
 import nltk
+import threading
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Tuple, List
-import io
+from typing import Tuple, List, Optional, Dict
+from backend.dedup import NearDuplicateIndex, DEDUP_REUSE, DEDUP_REUSE_THRESHOLD
+from backend.scoring import ScoringEngine, SIGNAL_LABELS
+from backend.cache import CacheBackend, create_cache, content_hash
+from backend.extractors import ExtractorRegistry, create_registry, EXTRACTOR_FAILURE_TTL
+from backend.sections import parse_resume, SECTION_HEADINGS, SECTION_WEIGHTS, LABEL_HEADINGS
 
 # Download required NLTK data (run once)
 try:
@@ -18,17 +22,67 @@ from nltk.corpus import stopwords
 class ResumeAnalyzer:
     """Advanced AI-powered Resume Analysis Engine"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheBackend] = None, extractors: Optional[ExtractorRegistry] = None):
+        self.cache = cache if cache is not None else create_cache()
+        self.extractors = extractors if extractors is not None else create_registry()
         self.stop_words = set(stopwords.words('english'))
         self.vectorizer = TfidfVectorizer(
             max_features=500,
             ngram_range=(1, 2),  # Unigrams and bigrams
             stop_words='english'
         )
+        self.scoring_engine = ScoringEngine(stop_words=self.stop_words)
+        self.duplicate_index = NearDuplicateIndex()
+        self.reuse_duplicates = DEDUP_REUSE
+        self.reuse_threshold = DEDUP_REUSE_THRESHOLD
+        self._lock = threading.Lock()  # Extraction runs outside it, see analyze
+        # Part of the parsed/analysis cache keys, so a shared cache never serves
+        # results computed under other scoring or section settings
+        self.config_fingerprint = content_hash(json.dumps({
+            "scoring": self.scoring_engine.config(),
+            "section_headings": SECTION_HEADINGS,
+            "label_headings": sorted(LABEL_HEADINGS),
+            "section_weights": SECTION_WEIGHTS
+        }, sort_keys=True))[:16]
+    
+    def extract_text(self, file_bytes: bytes) -> str:
+        """
+        Extracts text from a PDF, DOCX or TXT resume, detected from its contents
+        
+        Args:
+            file_bytes: Resume file as bytes
+            
+        Returns:
+            Extracted text as string
+            
+        Raises:
+            ValueError: If the file cannot be extracted (also for EXTRACTOR_FAILURE_TTL seconds afterwards)
+        """
+        file_hash = content_hash(file_bytes)
+        cache_key = f"text:{file_hash}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Failures are remembered briefly, so retrying a file that hangs a
+        # backend does not start another extraction each time
+        failure_key = f"text_error:{file_hash}"
+        failure = self.cache.get(failure_key)
+        if failure is not None:
+            raise ValueError(failure)
+        
+        try:
+            text = self.extractors.extract(file_bytes)
+        except ValueError as e:
+            self.cache.set(failure_key, str(e), ttl=EXTRACTOR_FAILURE_TTL)
+            raise
+        
+        self.cache.set(cache_key, text)
+        return text
     
     def extract_text_from_pdf(self, pdf_file: bytes) -> str:
         """
-        Extracts text from PDF using PyPDF2
+        Extracts text from PDF (kept for compatibility, see extract_text)
         
         Args:
             pdf_file: PDF file as bytes
@@ -36,14 +90,43 @@ class ResumeAnalyzer:
         Returns:
             Extracted text as string
         """
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_file))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + " "
-            return text.strip()
-        except Exception as e:
-            raise ValueError(f"Error extracting PDF text: {str(e)}")
+        return self.extract_text(pdf_file)
+    
+    def parse_resume(self, file_bytes: bytes) -> dict:
+        """
+        Parses the resume into sections (skills, experience, education, projects)
+        with per-section token vectors, cached by file hash
+        
+        Args:
+            file_bytes: Resume file as bytes
+            
+        Returns:
+            Structured resume, see backend.sections.parse_resume
+        """
+        cache_key = f"parsed:{content_hash(file_bytes)}:{self.config_fingerprint}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        parsed = parse_resume(self.extract_text(file_bytes), self.preprocess_text, self.stop_words)
+        
+        self.cache.set(cache_key, parsed)
+        return parsed
+    
+    def score_sections(self, parsed: dict, job_descriptions: List[str]) -> List[Tuple[float, Dict[str, float]]]:
+        """
+        Scores a parsed resume against several job descriptions, reusing its section vectors
+        
+        Args:
+            parsed: Output of parse_resume
+            job_descriptions: Job description texts
+            
+        Returns:
+            List of (weighted section score, per-section scores), one per job description
+        """
+        jds = [self.preprocess_text(jd) for jd in job_descriptions]
+        scores, details = self.scoring_engine.section_strategy.score_parsed([parsed], jds)
+        return [(round(float(score), 2), section_scores) for score, section_scores in zip(scores[0], details[0])]
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -90,91 +173,214 @@ class ResumeAnalyzer:
         
         return keywords
     
-    def calculate_match_score(self, resume_text: str, jd_text: str) -> Tuple[float, List[str], List[str]]:
+    def calculate_match_score(self, resume_text: str, jd_text: str, parsed: Optional[dict] = None) -> Tuple[float, List[str], List[str], Dict[str, float], Optional[Dict[str, float]]]:
         """
-        Calculates cosine similarity between resume and job description
+        Scores the resume against the job description with the configured strategy
         
         Args:
             resume_text: Resume text
             jd_text: Job description text
+            parsed: Parsed resume (see parse_resume), adds the section signal
             
         Returns:
-            Tuple of (match_score, missing_keywords, matched_keywords)
+            Tuple of (match_score, missing_keywords, matched_keywords, score_breakdown, section_scores)
         """
         # Preprocess texts
         resume_clean = self.preprocess_text(resume_text)
         jd_clean = self.preprocess_text(jd_text)
         
-        # Calculate cosine similarity
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform([resume_clean, jd_clean])
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        
-        # Convert to percentage
-        match_score = round(similarity * 100, 2)
+        # Score with every signal (cosine TF-IDF, BM25, skill coverage, sections)
+        match_score, score_breakdown, section_scores = self.scoring_engine.score(resume_clean, jd_clean, parsed)
         
         # Extract keywords from both texts
         resume_keywords = set(self.extract_keywords(resume_clean, top_n=40))
-        jd_keywords = set(self.extract_keywords(jd_clean, top_n=40))
+        jd_cache_key = f"jd_keywords:{content_hash(jd_clean)}"
+        jd_keywords = self.cache.get(jd_cache_key)
+        if jd_keywords is None:
+            jd_keywords = self.extract_keywords(jd_clean, top_n=40)
+            self.cache.set(jd_cache_key, jd_keywords)
+        jd_keywords = set(jd_keywords)
         
         # Find matched and missing keywords
         matched = list(resume_keywords.intersection(jd_keywords))
         missing = list(jd_keywords - resume_keywords)
         
-        return match_score, missing[:15], matched[:15]  # Limit for display
+        return match_score, missing[:15], matched[:15], score_breakdown, section_scores  # Limit for display
     
-    def generate_summary(self, match_score: float, missing_count: int) -> str:
+    def generate_summary(self, match_score: float, missing_count: int, score_breakdown: Optional[Dict[str, float]] = None) -> str:
         """
-        Generates human-readable summary based on match score
+        Generates human-readable summary based on match score and the individual signals
+        
+        The headline follows the match score; when another signal disagrees
+        by a full tier (e.g. good text similarity but low skill coverage),
+        a note pointing at that signal is appended.
         
         Args:
             match_score: Match percentage
             missing_count: Number of missing keywords
+            score_breakdown: Per-signal scores, see ScoringEngine.score
             
         Returns:
             Summary string
         """
         if match_score >= 80:
-            return f"🎯 Excellent Match! Your resume aligns strongly with the job requirements. Only {missing_count} skills to enhance."
+            summary = f"🎯 Excellent Match! Your resume aligns strongly with the job requirements. Only {missing_count} skills to enhance."
         elif match_score >= 60:
-            return f"✅ Good Match! Your resume shows solid alignment. Consider adding {missing_count} missing skills to strengthen your application."
+            summary = f"✅ Good Match! Your resume shows solid alignment. Consider adding {missing_count} missing skills to strengthen your application."
         elif match_score >= 40:
-            return f"⚠️ Moderate Match. Your resume has some relevant skills, but {missing_count} key skills are missing. Tailor your resume further."
+            summary = f"⚠️ Moderate Match. Your resume has some relevant skills, but {missing_count} key skills are missing. Tailor your resume further."
         else:
-            return f"❌ Low Match. Significant gaps detected. {missing_count} critical skills are missing. Consider gaining more relevant experience."
+            summary = f"❌ Low Match. Significant gaps detected. {missing_count} critical skills are missing. Consider gaining more relevant experience."
+        
+        signals = {name: score for name, score in (score_breakdown or {}).items() if name in SIGNAL_LABELS}
+        if signals:
+            weakest = min(signals, key=signals.get)
+            strongest = max(signals, key=signals.get)
+            if match_score >= 60 and signals[weakest] < 40:
+                summary += f" Note: {SIGNAL_LABELS[weakest]} is only {signals[weakest]:.0f}%, so some requirements may still be uncovered."
+            elif match_score < 40 and signals[strongest] >= 60:
+                summary += f" However, {SIGNAL_LABELS[strongest]} is {signals[strongest]:.0f}%, so the gap may be mostly in wording."
+        
+        return summary
     
     def analyze(self, pdf_file: bytes, job_description: str) -> dict:
         """
         Main analysis function - orchestrates the entire process
         
         Args:
-            pdf_file: PDF file as bytes
+            pdf_file: Resume file (PDF, DOCX or TXT) as bytes
             job_description: Job description text
             
         Returns:
             Dictionary with analysis results
         """
-        # Extract text from PDF
-        resume_text = self.extract_text_from_pdf(pdf_file)
+        # Extract text from the resume
+        resume_text = self.extract_text(pdf_file)
         
         if not resume_text or len(resume_text) < 50:
-            raise ValueError("Could not extract sufficient text from PDF. Ensure it's a valid text-based PDF.")
+            raise ValueError("Could not extract sufficient text from the resume. Ensure it's a text-based PDF, DOCX or TXT file.")
         
         if not job_description or len(job_description) < 20:
             raise ValueError("Job description is too short. Please provide a detailed job description.")
         
-        # Calculate match score and keywords
-        match_score, missing_keywords, matched_keywords = self.calculate_match_score(
-            resume_text, 
-            job_description
-        )
+        # The shared vectorizer, scoring engine and duplicate index are not thread-safe
+        with self._lock:
+            resume_hash = content_hash(pdf_file)
+            resume_clean = self.preprocess_text(resume_text)
+            jd_clean = self.preprocess_text(job_description)
+            jd_hash = content_hash(jd_clean)
+            
+            # Reuse the result of an identical resume/JD pair
+            result_cache_key = f"analysis:{resume_hash}:{jd_hash}:{self.config_fingerprint}"
+            cached = self.cache.get(result_cache_key)
+            if cached is not None:
+                return dict(cached)
+            
+            # Look up near-duplicate resumes analyzed before
+            signature = self.duplicate_index.hasher.signature(resume_clean)
+            jd_terms = self.jd_term_fingerprint(resume_clean, jd_clean)
+            duplicate_of, similarity, prior_result = self.find_duplicate(signature, jd_hash, resume_hash, jd_terms)
+            
+            if prior_result is not None and self.reuse_duplicates:
+                result = dict(prior_result)
+            else:
+                # Calculate match score and keywords, with each resume section scored as one of the signals
+                match_score, missing_keywords, matched_keywords, score_breakdown, section_scores = self.calculate_match_score(
+                    resume_text, 
+                    job_description,
+                    self.parse_resume(pdf_file)
+                )
+                
+                # Generate summary
+                summary = self.generate_summary(match_score, len(missing_keywords), score_breakdown)
+                
+                result = {
+                    "match_score": match_score,
+                    "missing_keywords": missing_keywords,
+                    "matched_keywords": matched_keywords,
+                    "summary": summary,
+                    "scoring_strategy": self.scoring_engine.strategy,
+                    "score_breakdown": score_breakdown,
+                    "section_scores": section_scores
+                }
+            
+            self.remember_result(resume_hash, signature, jd_hash, result, jd_terms)
+            
+            result["duplicate_of"] = duplicate_of
+            result["duplicate_similarity"] = similarity
+            self.cache.set(result_cache_key, result)
+            return dict(result)
+    
+    def jd_term_fingerprint(self, resume_clean: str, jd_clean: str) -> str:
+        """
+        Fingerprints the job description terms a resume contains
+        
+        Two resumes with the same fingerprint match the JD on exactly the
+        same terms, so an edit that adds or removes a relevant skill changes it.
+        
+        Args:
+            resume_clean: Preprocessed resume text
+            jd_clean: Preprocessed job description text
+            
+        Returns:
+            Hash of the sorted shared terms
+        """
+        terms = (set(resume_clean.split()) & set(jd_clean.split())) - self.stop_words
+        return content_hash(" ".join(sorted(terms)))
+    
+    def find_duplicate(self, signature, jd_hash: str, resume_hash: str, jd_terms: str) -> Tuple[Optional[str], Optional[float], Optional[dict]]:
+        """
+        Finds the most similar previously analyzed resume, other than this file itself
+        
+        Args:
+            signature: MinHash signature of the preprocessed resume
+            jd_hash: Hash of the preprocessed job description
+            resume_hash: SHA-256 of this resume file, never reported as its own duplicate
+            jd_terms: Fingerprint of the JD terms in this resume, see jd_term_fingerprint
+            
+        Returns:
+            Tuple of (resume_hash, similarity, prior_result). prior_result is
+            this file's own result for the job description, or that of a
+            near-duplicate at or above reuse_threshold that matched the same JD
+            terms; an edited resume otherwise always gets a fresh analysis.
+            Resubmissions of the same file are not flagged.
+        """
+        own_result = None
+        if resume_hash in self.duplicate_index.entries:
+            stored = self.duplicate_index.entries[resume_hash][1]["results"].get(jd_hash)
+            own_result = stored["result"] if stored is not None else None
+        
+        matches = [match for match in self.duplicate_index.query(signature) if match[0] != resume_hash]
+        if not matches:
+            return None, None, own_result
+        
+        for key, similarity, payload in matches:
+            stored = payload["results"].get(jd_hash)
+            if stored is not None and similarity >= self.reuse_threshold and stored["jd_terms"] == jd_terms:
+                return key, round(similarity, 4), stored["result"]
+        
+        key, similarity, _ = matches[0]
+        return key, round(similarity, 4), own_result
+    
+    def remember_result(self, resume_hash: str, signature, jd_hash: str, result: dict, jd_terms: str, max_jds: int = 20):
+        """
+        Records an analysis result in the near-duplicate index
+        
+        Args:
+            resume_hash: SHA-256 of the resume file
+            signature: MinHash signature of the preprocessed resume
+            jd_hash: Hash of the preprocessed job description
+            result: Analysis result to reuse for near-duplicates
+            jd_terms: Fingerprint of the JD terms in the resume, see jd_term_fingerprint
+            max_jds: Maximum number of job descriptions remembered per resume
+        """
+        results = {}
+        if resume_hash in self.duplicate_index.entries:
+            results = self.duplicate_index.entries[resume_hash][1]["results"]
         
-        # Generate summary
-        summary = self.generate_summary(match_score, len(missing_keywords))
+        results.pop(jd_hash, None)
+        results[jd_hash] = {"result": dict(result), "jd_terms": jd_terms}
+        while len(results) > max_jds:
+            results.pop(next(iter(results)))
         
-        return {
-            "match_score": match_score,
-            "missing_keywords": missing_keywords,
-            "matched_keywords": matched_keywords,
-            "summary": summary
-        }
\ No newline at end of file
+        self.duplicate_index.add(resume_hash, signature, {"results": results})
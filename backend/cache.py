@@ -0,0 +1,270 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Cache Configuration
+CACHE_URL = os.getenv("CACHE_URL", "memory://")  # memory://, sqlite:///path/to/cache.db, redis://host:port/db
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "5000"))
+CACHE_TTL = float(os.getenv("CACHE_TTL", "86400"))  # Seconds, 0 disables expiry
+
+
+def content_hash(data) -> str:
+    """SHA-256 hex digest of bytes or text, used to build cache keys"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class CacheBackend:
+    """Interface for result caches; values must be JSON-serializable"""
+
+    def __init__(self, default_ttl: float = CACHE_TTL):
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._stats_lock = threading.Lock()  # Lookups may run outside a backend's own lock
+
+    def _expiry(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.default_ttl if ttl is None else ttl
+        return time.time() + ttl if ttl and ttl > 0 else None
+
+    def _record(self, value: Any) -> Any:
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Fetches a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Stores a value
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time to live in seconds (defaults to the backend TTL)
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """Returns hit/miss/eviction counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "size": self.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+class MemoryLRUCache(CacheBackend):
+    """In-process LRU cache with TTLs"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, default_ttl: float = CACHE_TTL):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return self._record(None)
+
+            value, expires = entry
+            if expires is not None and expires < time.time():
+                del self._data[key]
+                self.expirations += 1
+                return self._record(None)
+
+            self._data.move_to_end(key)
+            return self._record(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (value, self._expiry(ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def size(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(CacheBackend):
+    """File-backed LRU cache shared by every worker process on the host"""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        default_ttl: float = CACHE_TTL,
+        evict_interval: int = 64
+    ):
+        super().__init__(default_ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._writes = 0
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return self._record(None)
+
+            value, expires = row
+            if expires is not None and expires < now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.expirations += 1
+                return self._record(None)
+
+            self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+        return self._record(json.loads(value))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, self._expiry(ttl), time.time())
+            )
+            self._writes += 1
+            if self._writes % self.evict_interval == 0:
+                self._evict()
+
+    def _evict(self):
+        """Drops expired entries, then the least recently used ones above the size limit"""
+        cursor = self._conn.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires < ?", (time.time(),))
+        self.expirations += max(cursor.rowcount, 0)
+
+        excess = self.size() - self.max_entries
+        if excess > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class KeyValueCache(CacheBackend):
+    """
+    Adapter for external key-value stores
+
+    The client needs `get(key)`, `set(key, value, ex=seconds)`, `delete(key)` and
+    `scan_iter(pattern)`, which matches redis-py; eviction and size limits are
+    left to the store.
+    """
+
+    def __init__(self, client, prefix: str = "resume_analyzer:", default_ttl: float = CACHE_TTL):
+        super().__init__(default_ttl)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.client.get(self.prefix + key)
+        return self._record(json.loads(value) if value is not None else None)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        self.client.set(self.prefix + key, json.dumps(value), ex=int(ttl) if ttl and ttl > 0 else None)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+    def size(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(self.prefix + "*"))
+
+
+def create_cache(url: str = CACHE_URL) -> CacheBackend:
+    """
+    Builds a cache backend from a URL
+
+    Args:
+        url: memory://, sqlite:///path/to/cache.db or redis://host:port/db
+
+    Returns:
+        Cache backend instance
+    """
+    if url.startswith("memory://"):
+        return MemoryLRUCache()
+    if url.startswith("sqlite://"):
+        return SQLiteCache(url[len("sqlite:///"):] or "cache.db")
+    if url.startswith("redis://") or url.startswith("rediss://"):
+        try:
+            import redis
+        except ImportError:
+            raise ValueError("The redis package is required for redis:// cache URLs")
+        return KeyValueCache(redis.Redis.from_url(url))
+    raise ValueError(f"Unsupported cache URL: {url}")
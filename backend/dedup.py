@@ -0,0 +1,223 @@
+import os
+import zlib
+import hashlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Near-duplicate Detection Configuration
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.9"))
+DEDUP_REUSE = os.getenv("DEDUP_REUSE", "false").lower() == "true"  # Default only flags near-duplicates
+DEDUP_REUSE_THRESHOLD = float(os.getenv("DEDUP_REUSE_THRESHOLD", "0.98"))  # Similarity needed to reuse a result
+DEDUP_MAX_ENTRIES = int(os.getenv("DEDUP_MAX_ENTRIES", "10000"))
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class MinHasher:
+    """Computes MinHash signatures over word shingles"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 42):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        # Universal hash family h(x) = (a*x + b) mod p; all values < 2^31 so products fit in uint64
+        self.a = rng.randint(1, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+    def shingles(self, text: str) -> Set[str]:
+        """
+        Splits preprocessed text into overlapping word shingles
+
+        Args:
+            text: Preprocessed text (see ResumeAnalyzer.preprocess_text)
+
+        Returns:
+            Set of shingles
+        """
+        words = text.split()
+        if len(words) < self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Computes the MinHash signature of a text
+
+        Args:
+            text: Preprocessed text
+
+        Returns:
+            Array of `num_perm` minimum hash values
+        """
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # (num_perm, num_shingles) matrix, reduced to the minimum per permutation
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimates Jaccard similarity from two signatures"""
+        return float(np.mean(sig_a == sig_b))
+
+
+class NearDuplicateIndex:
+    """LSH index over MinHash signatures for sub-linear near-duplicate lookup"""
+
+    def __init__(
+        self,
+        threshold: float = DEDUP_THRESHOLD,
+        num_perm: int = 128,
+        bands: int = 16,
+        max_entries: int = DEDUP_MAX_ENTRIES
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.buckets: List[Dict[bytes, Set[str]]] = [defaultdict(set) for _ in range(bands)]
+        self.entries: "OrderedDict[str, Tuple[np.ndarray, dict]]" = OrderedDict()
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            hashlib.blake2b(signature[i * self.rows:(i + 1) * self.rows].tobytes(), digest_size=8).digest()
+            for i in range(self.bands)
+        ]
+
+    def add(self, key: str, signature: np.ndarray, payload: Optional[dict] = None):
+        """
+        Adds a signature to the index, evicting the oldest entry when full
+
+        Args:
+            key: Unique entry identifier (e.g. resume hash)
+            signature: MinHash signature
+            payload: Data returned alongside lookups (e.g. prior results)
+        """
+        if key in self.entries:
+            self.remove(key)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self.buckets[band][band_key].add(key)
+        self.entries[key] = (signature, payload or {})
+
+        while len(self.entries) > self.max_entries:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, key: str):
+        """Removes an entry from the index"""
+        signature, _ = self.entries.pop(key)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self.buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band][band_key]
+
+    def query(self, signature: np.ndarray, threshold: Optional[float] = None) -> List[Tuple[str, float, dict]]:
+        """
+        Finds indexed entries similar to a signature
+
+        Args:
+            signature: MinHash signature to look up
+            threshold: Minimum estimated Jaccard similarity (defaults to the index threshold)
+
+        Returns:
+            List of (key, similarity, payload), most similar first
+        """
+        threshold = self.threshold if threshold is None else threshold
+        candidates: Set[str] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self.buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            other, payload = self.entries[key]
+            similarity = MinHasher.similarity(signature, other)
+            if similarity >= threshold:
+                matches.append((key, similarity, payload))
+
+        return sorted(matches, key=lambda m: m[1], reverse=True)
+
+
+def _benchmark(corpus_size: int = 5000, queries: int = 500, seed: int = 7):
+    """Measures lookup latency and recall on a synthetic corpus of perturbed resumes"""
+    import time
+    import random
+
+    rng = random.Random(seed)
+    vocab = [f"skill{i}" for i in range(3000)] + [
+        "python", "react", "docker", "kubernetes", "aws", "sql", "fastapi",
+        "experience", "developed", "managed", "team", "project", "years"
+    ]
+
+    def make_resume() -> List[str]:
+        return [rng.choice(vocab) for _ in range(rng.randint(300, 600))]
+
+    def perturb(words: List[str], rate: float) -> List[str]:
+        out = list(words)
+        for _ in range(int(len(out) * rate)):
+            op = rng.random()
+            pos = rng.randrange(len(out))
+            if op < 0.4:
+                out[pos] = rng.choice(vocab)
+            elif op < 0.7:
+                out.insert(pos, rng.choice(vocab))
+            elif len(out) > 1:
+                del out[pos]
+        return out
+
+    index = NearDuplicateIndex(threshold=0.7, max_entries=corpus_size)
+    base = [make_resume() for _ in range(corpus_size)]
+    signatures = []
+    start = time.perf_counter()
+    for i, words in enumerate(base):
+        signature = index.hasher.signature(" ".join(words))
+        signatures.append(signature)
+        index.add(str(i), signature)
+    build = time.perf_counter() - start
+
+    hits = 0
+    true_positives = 0
+    lsh_time = 0.0
+    brute_time = 0.0
+    all_signatures = np.vstack(signatures)
+    for _ in range(queries):
+        target = rng.randrange(corpus_size)
+        query_sig = index.hasher.signature(" ".join(perturb(base[target], rate=0.01)))
+
+        start = time.perf_counter()
+        found = index.query(query_sig)
+        lsh_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact = np.mean(all_signatures == query_sig, axis=1)
+        brute_time += time.perf_counter() - start
+
+        if exact[target] >= index.threshold:
+            true_positives += 1
+            hits += any(key == str(target) for key, _, _ in found)
+
+    print(f"Corpus: {corpus_size} resumes, {queries} queries (1% token perturbation)")
+    print(f"Index build: {build * 1000:.0f} ms ({build / corpus_size * 1e6:.0f} us/resume incl. MinHash)")
+    print(f"LSH lookup: {lsh_time / queries * 1e6:.1f} us/query")
+    print(f"Brute-force signature scan: {brute_time / queries * 1e6:.1f} us/query")
+    print(f"Recall: {hits}/{true_positives} = {hits / max(true_positives, 1):.3f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
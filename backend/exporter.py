@@ -0,0 +1,130 @@
+import io
+import os
+import csv
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+# Export Configuration
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))  # Documents per cursor batch and output chunk
+EXPORT_FIELDS = [
+    "_id",
+    "match_score",
+    "missing_keywords",
+    "matched_keywords",
+    "summary",
+    "scoring_strategy",
+    "score_breakdown",
+    "section_scores",
+    "duplicate_of",
+    "duplicate_similarity",
+    "resume_filename",
+    "job_description",
+    "timestamp"
+]
+
+
+def _normalize(doc: dict) -> dict:
+    """Converts BSON-specific values into JSON/CSV friendly ones"""
+    row = {}
+    for field in EXPORT_FIELDS:
+        value = doc.get(field)
+        if field == "_id" and value is not None:
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        row[field] = value
+    return row
+
+
+def _csv_value(value):
+    """Flattens list and dict values into a single CSV cell"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def encode_ndjson(doc: dict) -> bytes:
+    """
+    Encodes one analysis document as an NDJSON line
+
+    Args:
+        doc: Raw MongoDB document
+
+    Returns:
+        UTF-8 encoded JSON line
+    """
+    row = _normalize(doc)
+    if orjson is not None:
+        return orjson.dumps(row) + b"\n"
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def encode_csv(doc: Optional[dict]) -> bytes:
+    """
+    Encodes one analysis document as a CSV line
+
+    Args:
+        doc: Raw MongoDB document, or None to encode the header row
+
+    Returns:
+        UTF-8 encoded CSV line
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if doc is None:
+        writer.writerow(EXPORT_FIELDS)
+    else:
+        row = _normalize(doc)
+        writer.writerow([_csv_value(value) for value in row.values()])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(cursor, export_format: str = "ndjson", compress: bool = False) -> AsyncIterator[bytes]:
+    """
+    Streams a Motor cursor as NDJSON or CSV, one batch at a time
+
+    Args:
+        cursor: Motor cursor over the analyses collection
+        export_format: "ndjson" or "csv"
+        compress: Gzip-compress the stream
+
+    Yields:
+        Encoded (and optionally compressed) chunks
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 -> gzip container
+    chunk = bytearray()
+
+    def flush() -> bytes:
+        data = bytes(chunk)
+        chunk.clear()
+        return compressor.compress(data) if compressor is not None else data
+
+    if export_format == "csv":
+        chunk += encode_csv(None)
+    encode = encode_csv if export_format == "csv" else encode_ndjson
+
+    count = 0
+    async for doc in cursor:
+        chunk += encode(doc)
+        count += 1
+        if count % EXPORT_BATCH_SIZE == 0:
+            data = flush()
+            if data:
+                yield data
+
+    data = flush()
+    if compressor is not None:
+        data += compressor.flush()
+    if data:
+        yield data
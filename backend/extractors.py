@@ -0,0 +1,398 @@
+import io
+import os
+import re
+import codecs
+import zipfile
+import threading
+from typing import Dict, List, Optional, Set
+from xml.etree import ElementTree
+
+import PyPDF2
+
+from backend.profiler import current_profiler
+
+# Optional faster PDF backends
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # Older PyMuPDF releases
+    except ImportError:
+        pymupdf = None
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+except ImportError:
+    pdfminer_extract_text = None
+
+# Extraction Configuration
+PDF_BACKENDS = os.getenv("PDF_BACKENDS", "pymupdf,pypdf2")  # Tried in order, uninstalled ones are skipped
+EXTRACTOR_TIMEOUT = float(os.getenv("EXTRACTOR_TIMEOUT", "10"))  # Seconds per backend
+EXTRACTOR_MAX_ABANDONED = int(os.getenv("EXTRACTOR_MAX_ABANDONED", "4"))  # Timed-out backends still running
+EXTRACTOR_FAILURE_TTL = float(os.getenv("EXTRACTOR_FAILURE_TTL", "300"))  # Seconds a failed file is rejected without retrying
+DOCX_MAX_XML_BYTES = int(os.getenv("DOCX_MAX_XML_BYTES", str(20 * 1024 * 1024)))  # Uncompressed document.xml
+
+PDF = "pdf"
+DOCX = "docx"
+TXT = "txt"
+
+
+class ExtractorBusyError(RuntimeError):
+    """Raised when too many timed-out backends are still running to start another one"""
+
+
+def detect_document_type(data: bytes) -> Optional[str]:
+    """
+    Detects the document type from magic bytes, ignoring the filename
+
+    Args:
+        data: File contents
+
+    Returns:
+        "pdf", "docx", "txt" or None if unsupported
+    """
+    if b"%PDF-" in data[:1024]:
+        return PDF
+
+    if data.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return DOCX
+        except zipfile.BadZipFile:
+            pass
+        return None
+
+    sample = data[:4096]
+    try:
+        if sample.startswith((b"\xff\xfe", b"\xfe\xff")):
+            text = decode_text(sample)
+        else:
+            # Incremental decoding tolerates a multi-byte character cut off by the sample
+            text = codecs.getincrementaldecoder("utf-8-sig")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return None
+    printable = sum(1 for ch in text if ch.isprintable() or ch.isspace())
+    return TXT if text and printable / len(text) > 0.95 else None
+
+
+def decode_text(data: bytes) -> str:
+    """Decodes plain text, honouring UTF-16/UTF-8 byte order marks"""
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16", errors="ignore")
+    return data.decode("utf-8-sig")
+
+
+class Extractor:
+    """Base class for text extraction backends"""
+
+    name = ""
+
+    def available(self) -> bool:
+        return True
+
+    def extract(self, data: bytes) -> str:
+        """
+        Extracts text from a document
+
+        Args:
+            data: File contents
+
+        Returns:
+            Extracted text
+        """
+        raise NotImplementedError
+
+
+class PyPDF2Extractor(Extractor):
+    """Pure-Python PDF extraction, always available"""
+
+    name = "pypdf2"
+
+    def extract(self, data: bytes) -> str:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        text = ""
+        for page in pdf_reader.pages:
+            text += page.extract_text() + " "
+        return text.strip()
+
+
+class PyMuPDFExtractor(Extractor):
+    """PDF extraction through the MuPDF C library, robust on large or complex files"""
+
+    name = "pymupdf"
+
+    def available(self) -> bool:
+        return pymupdf is not None
+
+    def extract(self, data: bytes) -> str:
+        with pymupdf.open(stream=data, filetype="pdf") as document:
+            return " ".join(page.get_text() for page in document).strip()
+
+
+class PdfminerExtractor(Extractor):
+    """pdfminer.six PDF extraction, slow but layout-aware"""
+
+    name = "pdfminer"
+
+    def available(self) -> bool:
+        return pdfminer_extract_text is not None
+
+    def extract(self, data: bytes) -> str:
+        return pdfminer_extract_text(io.BytesIO(data)).strip()
+
+
+class DocxExtractor(Extractor):
+    """Reads paragraph text straight from the DOCX XML, no extra dependency needed"""
+
+    name = "docx"
+    _namespace = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+    def __init__(self, max_xml_bytes: int = DOCX_MAX_XML_BYTES):
+        self.max_xml_bytes = max_xml_bytes
+        # Tabs and breaks are separate elements, not part of the run text
+        self._whitespace = {
+            f"{self._namespace}tab": "\t",
+            f"{self._namespace}br": "\n",
+            f"{self._namespace}cr": "\n",
+        }
+
+    def extract(self, data: bytes) -> str:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            # Check the declared size first so a zip bomb is never inflated
+            size = archive.getinfo("word/document.xml").file_size
+            if size > self.max_xml_bytes:
+                raise ValueError(f"document.xml is {size} bytes uncompressed, limit is {self.max_xml_bytes}")
+            with archive.open("word/document.xml") as document:
+                xml = document.read(self.max_xml_bytes + 1)
+            if len(xml) > self.max_xml_bytes:
+                raise ValueError(f"document.xml exceeds {self.max_xml_bytes} bytes uncompressed")
+            root = ElementTree.fromstring(xml)
+
+        paragraphs = []
+        for paragraph in root.iter(f"{self._namespace}p"):
+            parts = []
+            for node in paragraph.iter():
+                if node.tag == f"{self._namespace}t":
+                    parts.append(node.text or "")
+                elif node.tag in self._whitespace:
+                    parts.append(self._whitespace[node.tag])
+            if parts:
+                paragraphs.append("".join(parts))
+        return "\n".join(paragraphs).strip()
+
+
+class TextExtractor(Extractor):
+    """Plain text files"""
+
+    name = "txt"
+
+    def extract(self, data: bytes) -> str:
+        try:
+            return decode_text(data).strip()
+        except UnicodeDecodeError:
+            return data.decode("latin-1").strip()
+
+
+PDF_EXTRACTORS = {
+    extractor.name: extractor
+    for extractor in (PyMuPDFExtractor, PdfminerExtractor, PyPDF2Extractor)
+}
+
+
+class ExtractorRegistry:
+    """Selects extractors by document type and falls back between backends"""
+
+    def __init__(self, timeout: float = EXTRACTOR_TIMEOUT, max_abandoned: int = EXTRACTOR_MAX_ABANDONED):
+        self.timeout = timeout
+        self.max_abandoned = max_abandoned
+        self.extractors: Dict[str, List[Extractor]] = {}
+        self._abandoned: Set[threading.Thread] = set()
+        self._abandoned_lock = threading.Lock()
+
+    def abandoned(self) -> int:
+        """Number of timed-out backends that are still running"""
+        with self._abandoned_lock:
+            self._abandoned = {thread for thread in self._abandoned if thread.is_alive()}
+            return len(self._abandoned)
+
+    def register(self, document_type: str, extractor: Extractor):
+        """Adds a backend for a document type; earlier registrations are tried first"""
+        if extractor.available():
+            self.extractors.setdefault(document_type, []).append(extractor)
+
+    def _run(self, extractor: Extractor, data: bytes) -> str:
+        """
+        Runs one backend on its own thread, giving up after the timeout
+
+        Each call gets a fresh daemon thread, so the timeout starts when the
+        backend starts and a hung backend, which cannot be interrupted, is
+        abandoned without holding up later documents or fallbacks. Abandoned
+        threads keep using CPU until they finish, so once `max_abandoned` of
+        them are running no new backend is started.
+
+        Args:
+            extractor: Backend to run
+            data: File contents
+
+        Returns:
+            Extracted text
+
+        Raises:
+            TimeoutError: If the backend did not finish in time
+            ExtractorBusyError: If too many abandoned backends are still running
+        """
+        if self.abandoned() >= self.max_abandoned:
+            raise ExtractorBusyError("Too many documents are still being extracted, please try again later.")
+
+        outcome = {}
+
+        def target():
+            try:
+                outcome["text"] = extractor.extract(data)
+            except Exception as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=target, name=f"extractor-{extractor.name}", daemon=True)
+        thread.start()
+        profiler = current_profiler()
+        if profiler is not None:
+            profiler.add_thread(thread.ident)
+        try:
+            thread.join(self.timeout)
+        finally:
+            if profiler is not None:
+                profiler.remove_thread(thread.ident)
+
+        if thread.is_alive():
+            with self._abandoned_lock:
+                self._abandoned.add(thread)
+            raise TimeoutError(f"timed out after {self.timeout:g}s")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["text"]
+
+    def extract(self, data: bytes) -> str:
+        """
+        Extracts text with the first backend that succeeds
+
+        Args:
+            data: File contents
+
+        Returns:
+            Extracted text
+
+        Raises:
+            ValueError: If the type is unsupported or every backend failed
+            ExtractorBusyError: If too many abandoned backends are still running
+        """
+        document_type = detect_document_type(data)
+        if document_type is None:
+            raise ValueError("Unsupported file type. Please upload a PDF, DOCX or TXT file.")
+
+        errors = []
+        for extractor in self.extractors.get(document_type, []):
+            try:
+                text = self._run(extractor, data)
+            except ExtractorBusyError:
+                raise
+            except Exception as e:
+                errors.append(f"{extractor.name}: {e}")
+                continue
+
+            if text:
+                return text
+            errors.append(f"{extractor.name}: no text found")
+
+        raise ValueError(f"Error extracting {document_type.upper()} text: {'; '.join(errors) or 'no extractor available'}")
+
+
+def create_registry(pdf_backends: str = PDF_BACKENDS, timeout: float = EXTRACTOR_TIMEOUT) -> ExtractorRegistry:
+    """
+    Builds the default registry
+
+    Args:
+        pdf_backends: Comma-separated PDF backends in order of preference
+        timeout: Per-backend timeout in seconds
+
+    Returns:
+        Configured extractor registry
+    """
+    registry = ExtractorRegistry(timeout=timeout)
+    for name in (backend.strip() for backend in pdf_backends.split(",")):
+        if name not in PDF_EXTRACTORS:
+            raise ValueError(f"Unknown PDF backend: {name}")
+        registry.register(PDF, PDF_EXTRACTORS[name]())
+    registry.register(DOCX, DocxExtractor())
+    registry.register(TXT, TextExtractor())
+    return registry
+
+
+def _benchmark(documents: int = 20, pages: int = 10, seed: int = 7):
+    """Compares PDF backends on synthetic resumes: throughput and recovered-word recall"""
+    import time
+    import random
+    from collections import Counter
+
+    rng = random.Random(seed)
+    vocab = "python react docker kubernetes aws sql fastapi mongodb developed managed led built " \
+            "scalable services team project years experience engineer machine learning data".split()
+
+    def make_pdf(words: List[str]) -> bytes:
+        # Minimal multi-page PDF with Helvetica text, one 80-char line per Tj
+        page_size = len(words) // pages + 1
+        objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+        kids = []
+        for p in range(pages):
+            line_words = words[p * page_size:(p + 1) * page_size]
+            lines, current = [], ""
+            for word in line_words:
+                if len(current) + len(word) > 80:
+                    lines.append(current)
+                    current = ""
+                current += word + " "
+            lines.append(current)
+            ops = "BT /F1 10 Tf 20 800 Td 12 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+            objects.append(f"<< /Length {len(ops)} >>\nstream\n{ops}\nendstream")
+            content_ref = len(objects)
+            objects.append(
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                f"/Contents {content_ref} 0 R /Resources << /Font << /F1 3 0 R >> >> >>"
+            )
+            kids.append(f"{len(objects)} 0 R")
+        objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+        out = b"%PDF-1.4\n"
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+        xref = len(out)
+        out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+        out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+        out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+        return out
+
+    corpus = []
+    for _ in range(documents):
+        words = [rng.choice(vocab) for _ in range(pages * 400)]
+        corpus.append((make_pdf(words), words))
+
+    print(f"{documents} synthetic PDFs, {pages} pages each")
+    for name, cls in PDF_EXTRACTORS.items():
+        extractor = cls()
+        if not extractor.available():
+            print(f"{name:>10}: not installed")
+            continue
+
+        start = time.perf_counter()
+        recall = 0.0
+        for data, words in corpus:
+            extracted = Counter(re.findall(r"[a-z]+", extractor.extract(data).lower()))
+            recall += sum((extracted & Counter(words)).values()) / len(words)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {documents / elapsed:6.1f} docs/s, word recall {recall / documents:.3f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -1,5 +1,6 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime
 import os
@@ -7,8 +8,17 @@ from dotenv import load_dotenv
 from backend.analyzer import ResumeAnalyzer  # ✅ Fixed - No 'backend.' prefix
 from backend.models import AnalysisResponse  # ✅ Fixed
 from backend.job_fetcher import JobDescriptionGenerator  # ✅ Fixed
+from backend.profiler import RequestProfiler, PROFILE_HEADER
+from backend.exporter import stream_export, EXPORT_BATCH_SIZE
+from backend.extractors import detect_document_type, ExtractorBusyError
+from backend.resilience import CircuitBreaker, DiskSpool, DatabaseMonitor, MONGO_CLIENT_OPTIONS
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import ConnectionFailure
 from typing import Optional
 from contextlib import asynccontextmanager
+import uuid
+import asyncio
 
 # Load environment variables
 load_dotenv()
@@ -18,6 +28,10 @@ db_client: Optional[AsyncIOMotorClient] = None
 db = None
 analyzer: ResumeAnalyzer = ResumeAnalyzer()
 jd_generator: JobDescriptionGenerator = JobDescriptionGenerator()
+request_profiler: RequestProfiler = RequestProfiler()
+db_breaker: CircuitBreaker = CircuitBreaker()
+db_spool: DiskSpool = DiskSpool()
+db_monitor: DatabaseMonitor = DatabaseMonitor(db_breaker, db_spool)
 
 # MongoDB Configuration
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
@@ -29,9 +43,11 @@ async def app_lifespan(app: FastAPI):
     global db_client, db
     # Startup
     try:
-        db_client = AsyncIOMotorClient(MONGODB_URL)
+        # Explicit timeouts so an unreachable server fails fast instead of blocking requests
+        db_client = AsyncIOMotorClient(MONGODB_URL, **MONGO_CLIENT_OPTIONS)
         db = db_client[DATABASE_NAME]
-        print(f"✅ Connected to MongoDB: {DATABASE_NAME}")
+        db_monitor.start(db_client, db)
+        print(f"✅ MongoDB client initialized: {DATABASE_NAME}")
     except Exception as e:
         print(f"⚠️ MongoDB connection failed: {e}")
         print("⚠️ App will run without database persistence")
@@ -39,6 +55,7 @@ async def app_lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    await db_monitor.stop()
     if db_client is not None:
         db_client.close()
         print("✅ MongoDB connection closed")
@@ -73,7 +90,8 @@ async def root():
         "status": "online",
         "message": "AI Resume Analyzer API is running",
         "version": "1.0.0",
-        "database": "connected" if db is not None else "not connected"
+        "database": "connected" if db is not None and not db_breaker.is_open else "not connected",
+        "database_health": db_monitor.status()
     }
 
 @app.get("/job-roles")
@@ -86,6 +104,14 @@ async def get_available_roles():
         "roles": sorted(roles)
     }
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss/eviction statistics of the result cache"""
+    return {
+        "success": True,
+        "stats": analyzer.cache.stats()
+    }
+
 @app.post("/generate-jd")
 async def generate_job_description(job_title: str = Form(...)):
     """Generate job description from job title"""
@@ -101,27 +127,25 @@ async def generate_job_description(job_title: str = Form(...)):
 
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze_resume(
-    file: UploadFile = File(..., description="Resume PDF file"),
+    request: Request,
+    response: Response,
+    file: UploadFile = File(..., description="Resume file (PDF, DOCX or TXT)"),
     job_description: str = Form(..., description="Job description text")
 ):
     """
     Main endpoint to analyze resume against job description
     
+    Operators can set the `X-Profile: <PROFILE_TOKEN>` header to capture a
+    profile of the analysis.
+    
     Args:
-        file: PDF resume file
+        file: Resume file (PDF, DOCX or TXT)
         job_description: Job description text
         
     Returns:
         Analysis results with match score, keywords, and summary
     """
     
-    # Validate file type
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(
-            status_code=400,
-            detail="Only PDF files are supported"
-        )
-    
     # Validate file size (max 5MB)
     contents = await file.read()
     if len(contents) > 5 * 1024 * 1024:
@@ -130,39 +154,28 @@ async def analyze_resume(
             detail="File size exceeds 5MB limit"
         )
     
-    try:
-        # Perform analysis
-        result = analyzer.analyze(contents, job_description)
-        
-        # Save to database if connected
-        analysis_id = None
-        if db is not None:
-            try:
-                analysis_doc = {
-                    "match_score": result["match_score"],
-                    "missing_keywords": result["missing_keywords"],
-                    "matched_keywords": result["matched_keywords"],
-                    "summary": result["summary"],
-                    "resume_filename": file.filename,
-                    "job_description": job_description[:500],
-                    "timestamp": datetime.utcnow()
-                }
-                
-                insert_result = await db.analyses.insert_one(analysis_doc)
-                analysis_id = str(insert_result.inserted_id)
-            except Exception as db_error:
-                print(f"Database save error: {db_error}")
-        
-        # Return response
-        return AnalysisResponse(
-            success=True,
-            match_score=result["match_score"],
-            missing_keywords=result["missing_keywords"],
-            matched_keywords=result["matched_keywords"],
-            summary=result["summary"],
-            analysis_id=analysis_id
+    # Validate file type from its contents, not the filename
+    if detect_document_type(contents) is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Only PDF, DOCX and TXT files are supported"
         )
-        
+    
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+    response.headers["X-Request-ID"] = request_id
+    force_profile = request_profiler.should_profile(request.headers.get(PROFILE_HEADER))
+    
+    def run_analysis() -> dict:
+        # Profiled on the worker thread, so other requests' samples never leak in
+        with request_profiler.session(request_id, contents, force=force_profile):
+            return analyzer.analyze(contents, job_description)
+    
+    try:
+        # Extraction and scoring are CPU-bound, keep them off the event loop
+        result = await asyncio.to_thread(run_analysis)
+        return await _persist_analysis(result, job_description, file.filename)
+    except ExtractorBusyError as be:
+        raise HTTPException(status_code=503, detail=str(be), headers={"Retry-After": "30"})
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
@@ -171,6 +184,69 @@ async def analyze_resume(
             detail=f"Analysis failed: {str(e)}"
         )
 
+async def _persist_analysis(result: dict, job_description: str, filename: str) -> AnalysisResponse:
+    """Persists the analysis, if the database is connected, and builds the response"""
+    # Save to database if connected
+    analysis_id = None
+    if db is not None:
+        analysis_doc = {
+            "match_score": result["match_score"],
+            "missing_keywords": result["missing_keywords"],
+            "matched_keywords": result["matched_keywords"],
+            "summary": result["summary"],
+            "scoring_strategy": result["scoring_strategy"],
+            "score_breakdown": result["score_breakdown"],
+            "section_scores": result.get("section_scores"),
+            "duplicate_of": result["duplicate_of"],
+            "duplicate_similarity": result["duplicate_similarity"],
+            "resume_filename": filename,
+            "job_description": job_description[:500],
+            "timestamp": datetime.utcnow()
+        }
+        analysis_id = await _save_analysis(analysis_doc)
+    
+    # Return response
+    return AnalysisResponse(
+        success=True,
+        match_score=result["match_score"],
+        missing_keywords=result["missing_keywords"],
+        matched_keywords=result["matched_keywords"],
+        summary=result["summary"],
+        analysis_id=analysis_id,
+        scoring_strategy=result["scoring_strategy"],
+        score_breakdown=result["score_breakdown"],
+        section_scores=result.get("section_scores"),
+        duplicate_of=result["duplicate_of"],
+        duplicate_similarity=result["duplicate_similarity"]
+    )
+
+async def _save_analysis(analysis_doc: dict) -> Optional[str]:
+    """
+    Inserts an analysis, spooling it to disk while the database is unavailable
+    
+    The id is assigned up front so spooled analyses keep it once replayed.
+    """
+    analysis_doc["_id"] = ObjectId()
+    
+    if db_breaker.allow():
+        try:
+            await db.analyses.insert_one(analysis_doc)
+            db_breaker.record_success()
+            return str(analysis_doc["_id"])
+        except ConnectionFailure as db_error:
+            db_breaker.record_failure()
+            print(f"Database save error, spooling analysis: {db_error}")
+        except Exception as db_error:
+            print(f"Database save error: {db_error}")
+            return None
+    
+    try:
+        db_spool.append(analysis_doc)
+        return str(analysis_doc["_id"])
+    except OSError as spool_error:
+        print(f"Spool write error: {spool_error}")
+        return None
+
 @app.get("/history")
 async def get_analysis_history(limit: int = 10):
     """
@@ -182,7 +258,7 @@ async def get_analysis_history(limit: int = 10):
     Returns:
         List of past analyses
     """
-    if db is None:
+    if db is None or db_breaker.is_open:
         raise HTTPException(
             status_code=503,
             detail="Database not connected"
@@ -207,10 +283,76 @@ async def get_analysis_history(limit: int = 10):
             detail=f"Failed to retrieve history: {str(e)}"
         )
 
+@app.get("/export")
+async def export_analyses(
+    format: str = "ndjson",
+    gzip: bool = False,
+    after_id: Optional[str] = None,
+    skip: int = 0,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    since: Optional[datetime] = None
+):
+    """
+    Stream all analyses (or a filtered slice) as NDJSON or CSV
+    
+    Records are ordered by `_id`, so an interrupted export can be resumed
+    by passing the last received `_id` as `after_id`.
+    
+    Args:
+        format: "ndjson" or "csv"
+        gzip: Download a gzip-compressed .gz file
+        after_id: Resume after this analysis id
+        skip: Number of matching records to skip
+        min_score: Minimum match score
+        max_score: Maximum match score
+        since: Only include analyses at or after this timestamp
+        
+    Returns:
+        Streaming response with one record per line
+    """
+    if db is None or db_breaker.is_open:
+        raise HTTPException(status_code=503, detail="Database not connected")
+    
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="Format must be 'ndjson' or 'csv'")
+    
+    query = {}
+    if after_id is not None:
+        try:
+            query["_id"] = {"$gt": ObjectId(after_id)}
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Invalid after_id")
+    if min_score is not None or max_score is not None:
+        query["match_score"] = {}
+        if min_score is not None:
+            query["match_score"]["$gte"] = min_score
+        if max_score is not None:
+            query["match_score"]["$lte"] = max_score
+    if since is not None:
+        query["timestamp"] = {"$gte": since}
+    
+    cursor = db.analyses.find(query).sort("_id", 1).skip(max(skip, 0)).batch_size(EXPORT_BATCH_SIZE)
+    
+    # A gzip export is a .gz download, not a transfer encoding clients would undo
+    if gzip:
+        media_type = "application/gzip"
+        filename = f"analyses.{format}.gz"
+    else:
+        media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+        filename = f"analyses.{format}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    
+    return StreamingResponse(
+        stream_export(cursor, format, compress=gzip),
+        media_type=media_type,
+        headers=headers
+    )
+
 @app.delete("/history/{analysis_id}")
 async def delete_analysis(analysis_id: str):
     """Delete a specific analysis record"""
-    if db is None:
+    if db is None or db_breaker.is_open:
         raise HTTPException(status_code=503, detail="Database not connected")
     
     try:
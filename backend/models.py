@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class AnalysisResult(BaseModel):
@@ -32,4 +32,9 @@ class AnalysisResponse(BaseModel):
     missing_keywords: List[str]
     matched_keywords: List[str]
     summary: str
-    analysis_id: Optional[str] = None
\ No newline at end of file
+    analysis_id: Optional[str] = None
+    scoring_strategy: Optional[str] = None
+    score_breakdown: Optional[Dict[str, float]] = None
+    section_scores: Optional[Dict[str, float]] = None
+    duplicate_of: Optional[str] = None
+    duplicate_similarity: Optional[float] = None
\ No newline at end of file
@@ -0,0 +1,342 @@
+import os
+import re
+import sys
+import glob
+import hmac
+import json
+import time
+import random
+import hashlib
+import threading
+from functools import lru_cache
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Tuple
+
+# Profiling Configuration
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "collapsed")  # "collapsed" or "speedscope"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))  # 0.0 - 1.0
+PROFILE_SLOW_MS = float(os.getenv("PROFILE_SLOW_MS", "0"))  # 0 disables auto-capture
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_SLOW_INTERVAL_MS = float(os.getenv("PROFILE_SLOW_INTERVAL_MS", "25"))  # Coarser, for unforced auto-capture
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")  # Operator secret for the X-Profile header; empty disables it
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))  # Oldest profiles are deleted beyond this
+PROFILE_MAX_BYTES = int(os.getenv("PROFILE_MAX_BYTES", str(2 * 1024 * 1024)))  # Per profile file
+PROFILE_HEADER = "x-profile"
+
+_active = threading.local()  # Sampler profiling the current thread, if any
+
+
+def current_profiler() -> Optional["SamplingProfiler"]:
+    """Returns the sampler profiling the calling thread, so helper threads can join it"""
+    return getattr(_active, "profiler", None)
+
+
+@lru_cache(maxsize=4096)
+def _frame_label(code) -> str:
+    """'function (file:line)' label of a code object, formatted once per function"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class _SamplerThread:
+    """
+    Single background thread that samples every active SamplingProfiler
+
+    Concurrent sessions share one sys._current_frames() call per tick
+    instead of each running its own sampling thread. The thread sleeps on a
+    condition while no session is active.
+    """
+
+    def __init__(self):
+        self._profilers = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, profiler: "SamplingProfiler"):
+        with self._lock:
+            self._profilers.add(profiler)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+
+    def unregister(self, profiler: "SamplingProfiler"):
+        # Taking the lock also waits for a sample of this profiler in progress
+        with self._lock:
+            self._profilers.discard(profiler)
+
+    @property
+    def active(self) -> int:
+        return len(self._profilers)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._profilers:
+                    self._wakeup.wait()
+                interval = min(profiler.interval for profiler in self._profilers)
+            time.sleep(interval)
+
+            with self._lock:
+                if not self._profilers:
+                    continue
+                frames = sys._current_frames()
+                now = time.perf_counter()
+                for profiler in self._profilers:
+                    if now >= profiler.next_sample:
+                        profiler.sample(frames)
+                        profiler.next_sample = now + profiler.interval
+
+
+_sampler_thread = _SamplerThread()
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples the stack of a thread and the helpers it waits on"""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.next_sample = 0.0
+        self._helpers: Dict[int, Tuple[str, ...]] = {}
+
+    def _frame_stack(self, frame) -> Tuple[str, ...]:
+        """Converts a frame into a root-first tuple of 'function (file:line)' labels"""
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def add_thread(self, thread_id: int):
+        """
+        Samples a helper thread in place of the calling thread while it waits on it
+
+        The helper's stacks are recorded below the caller's current stack,
+        so work moved to another thread stays attributed to its call site.
+
+        Args:
+            thread_id: Identifier of the helper thread
+        """
+        self._helpers[thread_id] = self._frame_stack(sys._getframe(1))
+
+    def remove_thread(self, thread_id: int):
+        """Stops sampling a helper thread added with add_thread"""
+        self._helpers.pop(thread_id, None)
+
+    def sample(self, frames: dict):
+        """
+        Records one sample from a sys._current_frames() snapshot
+
+        Args:
+            frames: Mapping of thread id to its current frame
+        """
+        sampled_helper = False
+        for thread_id, prefix in dict(self._helpers).items():
+            frame = frames.get(thread_id)
+            if frame is not None:
+                self.samples[prefix + self._frame_stack(frame)] += 1
+                sampled_helper = True
+        if sampled_helper:
+            return  # The profiled thread is only waiting on its helpers
+        frame = frames.get(self.thread_id)
+        if frame is not None:
+            self.samples[self._frame_stack(frame)] += 1
+
+    def start(self):
+        self.next_sample = time.perf_counter() + self.interval
+        _sampler_thread.register(self)
+
+    def stop(self):
+        _sampler_thread.unregister(self)
+
+    def trim(self, max_bytes: int):
+        """
+        Drops the least frequent stacks until the collapsed output fits in `max_bytes`
+
+        Args:
+            max_bytes: Size budget for the rendered profile
+        """
+        kept = Counter()
+        size = 0
+        for stack, count in self.samples.most_common():
+            line_size = sum(len(label) + 1 for label in stack) + len(str(count)) + 1
+            if size + line_size > max_bytes:
+                break
+            kept[stack] = count
+            size += line_size
+        self.samples = kept
+
+    def to_collapsed(self) -> str:
+        """
+        Renders samples in the collapsed-stack format used by flamegraph.pl / speedscope
+
+        Returns:
+            One 'frame;frame;frame count' line per unique stack
+        """
+        lines = [";".join(stack) + f" {count}" for stack, count in self.samples.items()]
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self, name: str) -> str:
+        """
+        Renders samples as a speedscope 'sampled' profile
+
+        Args:
+            name: Profile name shown in the speedscope UI
+
+        Returns:
+            Speedscope JSON document as string
+        """
+        frame_index = {}
+        frames: List[dict] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        interval_ms = self.interval * 1000
+
+        for stack, count in self.samples.items():
+            indices = []
+            for label in stack:
+                if label not in frame_index:
+                    frame_index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(frame_index[label])
+            samples.append(indices)
+            weights.append(count * interval_ms)
+
+        return json.dumps({
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights
+            }],
+            "name": name,
+            "exporter": "resume-analyzer"
+        })
+
+
+class RequestProfiler:
+    """Opt-in per-request profiling, triggered by header, sampling rate or latency threshold"""
+
+    def __init__(
+        self,
+        output_dir: str = PROFILE_DIR,
+        output_format: str = PROFILE_FORMAT,
+        sample_rate: float = PROFILE_SAMPLE_RATE,
+        slow_ms: float = PROFILE_SLOW_MS,
+        interval_ms: float = PROFILE_INTERVAL_MS,
+        slow_interval_ms: float = PROFILE_SLOW_INTERVAL_MS,
+        token: str = PROFILE_TOKEN,
+        max_files: int = PROFILE_MAX_FILES,
+        max_bytes: int = PROFILE_MAX_BYTES
+    ):
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.interval = interval_ms / 1000
+        self.slow_interval = slow_interval_ms / 1000
+        self.token = token
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+
+    def should_profile(self, header_value: Optional[str]) -> bool:
+        """
+        Decides whether a request is explicitly selected for profiling
+
+        The header only counts when it carries the operator's PROFILE_TOKEN,
+        so anonymous clients cannot force profiles to be written.
+
+        Args:
+            header_value: Value of the X-Profile request header, if any
+
+        Returns:
+            True if the header carries the token or the request was sampled
+        """
+        if self.token and header_value is not None and hmac.compare_digest(header_value.strip(), self.token):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def session(self, request_id: str, pdf_file: bytes, force: bool = False):
+        """
+        Profiles the enclosed block on the current thread
+
+        The profile is written when `force` is set, or when the block runs
+        longer than the slow-request threshold. With no threshold configured
+        and `force` unset, this is a no-op. Unforced sessions sample at the
+        coarser slow interval, since auto-capture covers every request.
+        Helper threads started from the block can join the session through
+        current_profiler().
+
+        Args:
+            request_id: Request identifier used to tag the output file
+            pdf_file: Uploaded PDF bytes, hashed to tag the output file
+            force: Always write the profile for this request
+        """
+        if not force and self.slow_ms <= 0:
+            yield
+            return
+
+        profiler = SamplingProfiler(threading.get_ident(), self.interval if force else self.slow_interval)
+        profiler.start()
+        _active.profiler = profiler
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _active.profiler = None
+            profiler.stop()
+            if force or elapsed_ms >= self.slow_ms:
+                pdf_hash = hashlib.sha256(pdf_file).hexdigest()
+                try:
+                    path = self._write(profiler, request_id, pdf_hash, elapsed_ms)
+                    print(f"📊 Profile written for request {request_id} ({elapsed_ms:.0f} ms): {path}")
+                except OSError as e:
+                    print(f"⚠️ Failed to write profile for request {request_id}: {e}")
+
+    def _write(self, profiler: SamplingProfiler, request_id: str, pdf_hash: str, elapsed_ms: float) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._prune(keep=self.max_files - 1)
+        profiler.trim(self.max_bytes)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', request_id)[:64]
+        name = f"{stamp}_{safe_id}_{pdf_hash[:16]}_{elapsed_ms:.0f}ms"
+
+        if self.output_format == "speedscope":
+            path = os.path.join(self.output_dir, name + ".speedscope.json")
+            content = profiler.to_speedscope(name)
+        else:
+            path = os.path.join(self.output_dir, name + ".collapsed")
+            content = profiler.to_collapsed()
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _prune(self, keep: int):
+        """Deletes the oldest profiles so that at most `keep` remain"""
+        paths = glob.glob(os.path.join(self.output_dir, "*.collapsed"))
+        paths += glob.glob(os.path.join(self.output_dir, "*.speedscope.json"))
+
+        def mtime(path: str) -> float:
+            try:
+                return os.path.getmtime(path)
+            except OSError:  # Removed by another worker meanwhile
+                return 0.0
+
+        paths.sort(key=mtime)
+        for path in paths[:max(len(paths) - max(keep, 0), 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
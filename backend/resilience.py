@@ -0,0 +1,283 @@
+import os
+import time
+import glob
+import asyncio
+from typing import Optional
+
+from bson import json_util
+from pymongo.errors import BulkWriteError
+
+# MongoDB Connection Configuration
+MONGO_CLIENT_OPTIONS = {
+    "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "2000")),
+    "connectTimeoutMS": int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "2000")),
+    "socketTimeoutMS": int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "5000")),
+    "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "1000")),
+    "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "50")),
+    "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+}
+DB_FAILURE_THRESHOLD = int(os.getenv("DB_FAILURE_THRESHOLD", "3"))
+DB_RESET_TIMEOUT = float(os.getenv("DB_RESET_TIMEOUT", "30"))  # Seconds before a trial request
+DB_HEALTH_INTERVAL = float(os.getenv("DB_HEALTH_INTERVAL", "10"))  # Seconds between pings
+SPOOL_DIR = os.getenv("SPOOL_DIR", "spool")
+SPOOL_REPLAY_BATCH = int(os.getenv("SPOOL_REPLAY_BATCH", "500"))
+SPOOL_STALE_SECONDS = 60  # Spool files of other workers idle this long can be replayed
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker guarding database calls"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = DB_FAILURE_THRESHOLD, reset_timeout: float = DB_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._state = self.CLOSED
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def allow(self) -> bool:
+        """
+        Checks whether a call may go to the database
+
+        Returns:
+            False while open; in half-open state a single trial call is let through
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN:
+            # Re-open until the trial call reports back
+            self._state = self.OPEN
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self):
+        if self._state != self.CLOSED:
+            print("✅ Database circuit closed")
+        self.failures = 0
+        self.opened_at = None
+        self._state = self.CLOSED
+
+    def record_failure(self):
+        self.failures += 1
+        if self._state != self.OPEN and (self._state == self.HALF_OPEN or self.failures >= self.failure_threshold):
+            print(f"⚠️ Database circuit opened after {self.failures} failures")
+            self._state = self.OPEN
+        if self._state == self.OPEN:
+            self.opened_at = time.monotonic()
+
+
+class DiskSpool:
+    """Durable on-disk queue of documents that could not be written to MongoDB"""
+
+    def __init__(self, directory: str = SPOOL_DIR):
+        self.directory = directory
+        self.path = os.path.join(directory, f"spool-{os.getpid()}.ndjson")
+        # Kept in memory so health checks never scan the spool files
+        self.pending = self._count_on_disk()
+
+    def _count_on_disk(self) -> int:
+        count = 0
+        for path in glob.glob(os.path.join(self.directory, "spool-*.ndjson*")):
+            try:
+                with open(path, "rb") as f:
+                    count += sum(1 for _ in f)
+            except FileNotFoundError:
+                continue  # Renamed or replayed by another worker meanwhile
+        return count
+
+    def append(self, doc: dict):
+        """
+        Appends a document to this worker's spool file
+
+        Args:
+            doc: MongoDB document, with `_id` already assigned so replays are idempotent
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        record = (json_util.dumps(doc) + "\n").encode("utf-8")
+        with open(self.path, "a+b") as f:
+            # A crash mid-append leaves a partial last line; never extend it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    record = b"\n" + record
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending += 1
+
+    def pending_files(self) -> list:
+        """Spool files this worker may replay: its own, plus stale ones left by other workers"""
+        files = []
+        now = time.time()
+        claimed_by_me = f".replaying-{os.getpid()}-"
+        for path in glob.glob(os.path.join(self.directory, "spool-*.ndjson*")):
+            if path == self.path or claimed_by_me in path:
+                files.append(path)
+                continue
+            try:
+                if now - os.path.getmtime(path) >= SPOOL_STALE_SECONDS:
+                    files.append(path)
+            except FileNotFoundError:
+                continue  # Claimed by another worker meanwhile
+        return files
+
+    def size(self) -> int:
+        """
+        Approximate number of spooled documents
+
+        Counted from disk at startup, then tracked in memory by this worker;
+        documents spooled later by other workers are not included.
+        """
+        return self.pending
+
+    async def replay(self, collection, batch_size: int = SPOOL_REPLAY_BATCH) -> int:
+        """
+        Replays spooled documents into a collection in bulk
+
+        Files are claimed by renaming, so concurrent workers never replay the
+        same file, and new documents are appended to a fresh file meanwhile.
+        A claimed file is deleted only after all its documents are stored;
+        on failure it stays claimed and is retried on the next replay.
+        Lines that cannot be decoded, such as a record cut off by a crash,
+        are moved to a `.corrupt` file next to it instead of blocking replay.
+
+        Args:
+            collection: Motor collection to insert into
+            batch_size: Documents per insert_many call
+
+        Returns:
+            Number of documents replayed
+        """
+        replayed = 0
+        claimed_by_me = f".replaying-{os.getpid()}-"
+        for path in self.pending_files():
+            if claimed_by_me in path:
+                claimed = path
+            else:
+                base = path.split(".replaying-")[0]
+                claimed = f"{base}{claimed_by_me}{time.time_ns()}"
+                try:
+                    os.rename(path, claimed)
+                except OSError:
+                    continue  # Claimed by another worker
+
+            processed = 0
+            corrupt = 0
+            try:
+                with open(claimed, encoding="utf-8", errors="replace") as f:
+                    batch = []
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            batch.append(json_util.loads(line))
+                        except (ValueError, TypeError):
+                            self._quarantine(claimed, line)
+                            corrupt += 1
+                            continue
+                        if len(batch) >= batch_size:
+                            replayed += await self._insert_batch(collection, batch)
+                            processed += len(batch)
+                            batch = []
+                    if batch:
+                        replayed += await self._insert_batch(collection, batch)
+                        processed += len(batch)
+                os.remove(claimed)
+            except FileNotFoundError:
+                continue  # Taken over as stale by another worker; inserts are idempotent
+            if corrupt:
+                print(f"⚠️ Moved {corrupt} undecodable spool line(s) from {claimed} to .corrupt")
+            self.pending = max(self.pending - processed - corrupt, 0)
+
+        return replayed
+
+    def _quarantine(self, claimed: str, line: str):
+        """Appends an undecodable line to the `.corrupt` file of its spool file, outside the replay glob"""
+        base = claimed.split(".replaying-")[0]
+        path = base[:-len(".ndjson")] + ".corrupt" if base.endswith(".ndjson") else base + ".corrupt"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line if line.endswith("\n") else line + "\n")
+
+    @staticmethod
+    async def _insert_batch(collection, batch: list) -> int:
+        try:
+            result = await collection.insert_many(batch, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Documents already stored by an earlier partial replay are fine
+            errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+            if errors:
+                raise
+            return e.details.get("nInserted", 0)
+
+
+class DatabaseMonitor:
+    """Pings MongoDB in the background, drives the circuit breaker and replays the spool on recovery"""
+
+    def __init__(self, breaker: CircuitBreaker, spool: DiskSpool, interval: float = DB_HEALTH_INTERVAL):
+        self.breaker = breaker
+        self.spool = spool
+        self.interval = interval
+        self.last_ping_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self, client, db):
+        """Pings the server once and replays spooled documents if it is healthy"""
+        start = time.perf_counter()
+        try:
+            await client.admin.command("ping")
+        except Exception as e:
+            self.last_error = str(e)
+            self.breaker.record_failure()
+            return
+
+        self.last_ping_ms = round((time.perf_counter() - start) * 1000, 2)
+        self.last_error = None
+        self.breaker.record_success()
+
+        try:
+            replayed = await self.spool.replay(db.analyses)
+            if replayed:
+                print(f"✅ Replayed {replayed} spooled analyses")
+        except Exception as e:
+            print(f"⚠️ Spool replay failed: {e}")
+
+    async def _run(self, client, db):
+        while True:
+            await self.check(client, db)
+            await asyncio.sleep(self.interval)
+
+    def start(self, client, db):
+        self._task = asyncio.create_task(self._run(client, db))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> dict:
+        return {
+            "circuit": self.breaker.state,
+            "last_ping_ms": self.last_ping_ms,
+            "last_error": self.last_error,
+            "spooled": self.spool.size()
+        }
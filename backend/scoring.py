@@ -0,0 +1,359 @@
+import os
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from backend.job_fetcher import JobDescriptionGenerator
+from backend.sections import score_sections, token_vector
+
+# Scoring Configuration
+SCORING_STRATEGY = os.getenv("SCORING_STRATEGY", "cosine")  # "cosine", "bm25", "skill_coverage", "sections" or "blend"
+SCORING_WEIGHTS = os.getenv("SCORING_WEIGHTS", "cosine:0.5,bm25:0.3,skill_coverage:0.2")
+
+
+def template_skill_terms() -> Set[str]:
+    """
+    Skill vocabulary from the "Required Skills" lists of the job templates
+
+    Category labels before a colon ("Frontend:", "Version Control:") are
+    dropped, so only the listed technologies and practices remain.
+
+    Returns:
+        Terms as produced by the scoring tokenizer
+    """
+    analyzer = CountVectorizer(stop_words='english').build_analyzer()
+    terms = set()
+    for description in JobDescriptionGenerator.JOB_TEMPLATES.values():
+        skills = description.split("Required Skills:", 1)[-1].split("Responsibilities:", 1)[0]
+        for line in skills.splitlines():
+            line = line.strip().lstrip("-").strip()
+            terms.update(analyzer(line.split(":", 1)[-1]))
+    return terms
+
+
+class ScoringStrategy:
+    """Base class for resume/job description scoring strategies"""
+
+    name = ""
+
+    def score_matrix(self, resumes: List[str], jds: List[str]) -> np.ndarray:
+        """
+        Scores every resume against every job description in a single pass
+
+        Args:
+            resumes: Preprocessed resume texts
+            jds: Preprocessed job description texts
+
+        Returns:
+            Array of shape (len(resumes), len(jds)) with scores in [0, 100]
+        """
+        raise NotImplementedError
+
+
+class CosineTfidfStrategy(ScoringStrategy):
+    """Cosine similarity between TF-IDF vectors"""
+
+    name = "cosine"
+
+    def score_matrix(self, resumes: List[str], jds: List[str]) -> np.ndarray:
+        tfidf_matrix = TfidfVectorizer().fit_transform(resumes + jds)  # Rows are L2-normalized
+        similarity = tfidf_matrix[:len(resumes)] @ tfidf_matrix[len(resumes):].T
+        return similarity.toarray() * 100
+
+
+class BM25Strategy(ScoringStrategy):
+    """Okapi BM25 with job description terms as the query, scaled so matching each term once scores 100"""
+
+    name = "bm25"
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, background: Optional[List[str]] = None):
+        self.k1 = k1
+        self.b = b
+        # Job descriptions that IDF is computed over, besides the ones being scored
+        self.background = background if background is not None else list(JobDescriptionGenerator.JOB_TEMPLATES.values())
+
+    def score_matrix(self, resumes: List[str], jds: List[str]) -> np.ndarray:
+        texts = resumes + jds + self.background
+        counts = CountVectorizer(stop_words='english').fit_transform(texts).tocsr().astype(np.float64)
+        docs = counts[:len(resumes)]
+        queries = counts[len(resumes):len(resumes) + len(jds)]
+
+        # Non-negative IDF over the job descriptions plus the background corpus.
+        # Resumes are left out, as counting them would make every term a resume
+        # matches look common. The background keeps IDF meaningful when only one
+        # JD is scored, where every term would otherwise have df == 1.
+        df = np.bincount(counts[len(resumes):].indices, minlength=counts.shape[1])
+        idf = np.log(1 + (len(jds) + len(self.background) - df + 0.5) / (df + 0.5))
+
+        # Saturate term frequencies in place: tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+        doc_len = np.asarray(docs.sum(axis=1)).ravel()
+        avg_len = doc_len.mean() if doc_len.mean() > 0 else 1.0
+        norm = self.k1 * (1 - self.b + self.b * doc_len / avg_len)
+        rows = np.repeat(np.arange(docs.shape[0]), np.diff(docs.indptr))
+        docs.data = docs.data * (self.k1 + 1) / (docs.data + norm[rows])
+
+        # Binary query terms weighted by IDF
+        queries.data = np.ones_like(queries.data)
+        weighted_queries = queries @ sp.diags(idf)
+
+        scores = (docs @ weighted_queries.T).toarray()
+        # A term seen once in an average-length document contributes exactly its IDF
+        max_scores = np.asarray(weighted_queries.sum(axis=1)).ravel()
+        scores = np.divide(scores * 100, max_scores, out=np.zeros_like(scores), where=max_scores > 0)
+        return np.minimum(scores, 100)
+
+
+class SkillCoverageStrategy(ScoringStrategy):
+    """
+    Share of the job description's skills found in the resume, weighted by how often the JD mentions them
+
+    Only terms in the skill vocabulary count, so words like "responsibilities",
+    "team" or "years" do not. A JD naming no known skill falls back to all its terms.
+    """
+
+    name = "skill_coverage"
+
+    def __init__(self, skill_terms: Optional[Iterable[str]] = None):
+        self.skill_terms = set(skill_terms) if skill_terms is not None else template_skill_terms()
+
+    def score_matrix(self, resumes: List[str], jds: List[str]) -> np.ndarray:
+        vectorizer = CountVectorizer(stop_words='english')
+        counts = vectorizer.fit_transform(resumes + jds).tocsr().astype(np.float64)
+        present = counts[:len(resumes)]
+        present.data = np.ones_like(present.data)
+
+        weights = counts[len(resumes):]
+        weights.data = np.log1p(weights.data)
+
+        is_skill = np.isin(vectorizer.get_feature_names_out(), list(self.skill_terms)).astype(np.float64)
+        skill_weights = weights @ sp.diags(is_skill)
+        no_skills = (np.asarray(skill_weights.sum(axis=1)).ravel() == 0).astype(np.float64)
+        weights = (skill_weights + sp.diags(no_skills) @ weights).tocsr()
+
+        covered = (present @ weights.T).toarray()
+        total = np.asarray(weights.sum(axis=1)).ravel()
+        return np.divide(covered * 100, total, out=np.zeros_like(covered), where=total > 0)
+
+
+class SectionStrategy:
+    """Weighted similarity of each resume section to the JD, scored from parsed resumes (see backend.sections)"""
+
+    name = "sections"
+
+    def __init__(self, stop_words: Iterable[str] = ()):
+        self.stop_words = set(stop_words)
+
+    def score_parsed(self, parsed: List[dict], jds: List[str]) -> Tuple[np.ndarray, List[List[Dict[str, float]]]]:
+        """
+        Scores parsed resumes against job descriptions, reusing their section vectors
+
+        Args:
+            parsed: Parsed resumes, see backend.sections.parse_resume
+            jds: Preprocessed job description texts
+
+        Returns:
+            Tuple of (array of shape (len(parsed), len(jds)) with scores in [0, 100],
+            per-section scores for every resume/JD pair)
+        """
+        jd_vectors = [token_vector(jd, self.stop_words) for jd in jds]
+        scores = np.zeros((len(parsed), len(jds)))
+        details = []
+        for i, resume in enumerate(parsed):
+            row = []
+            for j, jd_vector in enumerate(jd_vectors):
+                scores[i, j], section_scores = score_sections(resume, jd_vector)
+                row.append(section_scores)
+            details.append(row)
+        return scores, details
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (CosineTfidfStrategy, BM25Strategy, SkillCoverageStrategy)
+}
+# Every signal that can be selected or blended; "sections" needs parsed resumes
+SIGNALS = list(STRATEGIES) + [SectionStrategy.name]
+
+# Human-readable signal names, used in summaries
+SIGNAL_LABELS = {
+    "cosine": "text similarity",
+    "bm25": "keyword relevance",
+    "skill_coverage": "skill coverage",
+    "sections": "section match",
+}
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    Parses a "name:weight,name:weight" specification
+
+    Args:
+        spec: Weight specification string
+
+    Returns:
+        Mapping of strategy name to weight
+    """
+    weights = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, weight = item.partition(":")
+        name = name.strip()
+        if name not in SIGNALS:
+            raise ValueError(f"Unknown scoring strategy: {name}")
+        weights[name] = float(weight)
+    return weights
+
+
+class ScoringEngine:
+    """Runs all scoring strategies and combines them into a single match score"""
+
+    def __init__(self, strategy: str = SCORING_STRATEGY, weights: Optional[Dict[str, float]] = None, stop_words: Iterable[str] = ()):
+        if strategy != "blend" and strategy not in SIGNALS:
+            raise ValueError(f"Unknown scoring strategy: {strategy}")
+        self.strategy = strategy
+        self.weights = weights if weights is not None else parse_weights(SCORING_WEIGHTS)
+        self.strategies = {name: cls() for name, cls in STRATEGIES.items()}
+        self.section_strategy = SectionStrategy(stop_words)
+
+    def config(self) -> dict:
+        """
+        Settings that affect scores, used to fingerprint cached results
+
+        Returns:
+            JSON-serializable description of the strategy, weights and signal parameters
+        """
+        bm25 = self.strategies[BM25Strategy.name]
+        return {
+            "strategy": self.strategy,
+            "weights": self.weights,
+            "bm25": {"k1": bm25.k1, "b": bm25.b, "background": bm25.background},
+            "skill_terms": sorted(self.strategies[SkillCoverageStrategy.name].skill_terms),
+            "section_stop_words": sorted(self.section_strategy.stop_words),
+        }
+
+    def _score_all(self, resumes: List[str], jds: List[str], parsed: Optional[List[dict]]):
+        signals = {name: strategy.score_matrix(resumes, jds) for name, strategy in self.strategies.items()}
+        details = None
+        if parsed is not None:
+            signals[SectionStrategy.name], details = self.section_strategy.score_parsed(parsed, jds)
+        signals["blend"] = self.combine(signals)
+        return signals, details
+
+    def score_all(self, resumes: List[str], jds: List[str], parsed: Optional[List[dict]] = None) -> Dict[str, np.ndarray]:
+        """
+        Computes every signal for every resume/JD pair
+
+        Args:
+            resumes: Preprocessed resume texts
+            jds: Preprocessed job description texts
+            parsed: Parsed resumes in the same order, enables the "sections" signal
+
+        Returns:
+            Mapping of signal name to (len(resumes), len(jds)) score matrix
+        """
+        return self._score_all(resumes, jds, parsed)[0]
+
+    def combine(self, signals: Dict[str, np.ndarray]) -> np.ndarray:
+        """Weighted average of the individual signals, renormalized over the signals computed"""
+        weights = {name: weight for name, weight in self.weights.items() if name in signals}
+        total_weight = sum(weights.values())
+        if total_weight <= 0:
+            raise ValueError("Scoring weights must sum to a positive value")
+        return sum(signals[name] * weight for name, weight in weights.items()) / total_weight
+
+    def score(self, resume: str, jd: str, parsed: Optional[dict] = None) -> Tuple[float, Dict[str, float], Optional[Dict[str, float]]]:
+        """
+        Scores a single resume against a single job description
+
+        Args:
+            resume: Preprocessed resume text
+            jd: Preprocessed job description text
+            parsed: Parsed resume, enables the "sections" signal
+
+        Returns:
+            Tuple of (match_score, per-signal breakdown, per-section scores or None)
+        """
+        if parsed is None and self.strategy == SectionStrategy.name:
+            raise ValueError("The sections strategy needs a parsed resume")
+        signals, details = self._score_all([resume], [jd], None if parsed is None else [parsed])
+        breakdown = {name: round(float(matrix[0, 0]), 2) for name, matrix in signals.items()}
+        return breakdown[self.strategy], breakdown, details[0][0] if details else None
+
+
+def compare_strategies(resumes: List[str], jds: List[str], expected: List[int]) -> Dict[str, Dict[str, float]]:
+    """
+    Compares strategies offline on resumes with a known best-matching JD
+
+    Args:
+        resumes: Preprocessed resume texts
+        jds: Preprocessed job description texts
+        expected: Index into `jds` of the correct job description for each resume
+
+    Returns:
+        Mapping of signal name to top-1 accuracy, mean reciprocal rank and
+        mean margin between the correct JD and the best wrong one
+    """
+    engine = ScoringEngine(strategy="blend")
+    expected = np.asarray(expected)
+    rows = np.arange(len(resumes))
+    report = {}
+
+    for name, matrix in engine.score_all(resumes, jds).items():
+        correct = matrix[rows, expected]
+        ranks = (matrix > correct[:, None]).sum(axis=1) + 1
+        others = matrix.copy()
+        others[rows, expected] = -np.inf
+        report[name] = {
+            "top1": float(np.mean(ranks == 1)),
+            "mrr": float(np.mean(1 / ranks)),
+            "margin": float(np.mean(correct - others.max(axis=1)))
+        }
+    return report
+
+
+def _benchmark(resumes_per_role: int = 20, seed: int = 7):
+    """Compares strategies on synthetic resumes built from the job templates"""
+    import re
+    import time
+    import random
+    from backend.job_fetcher import JobDescriptionGenerator
+
+    rng = random.Random(seed)
+
+    def clean(text: str) -> str:
+        return ' '.join(re.sub(r'[^a-z0-9\s+#]', ' ', text.lower()).split())
+
+    roles = list(JobDescriptionGenerator.JOB_TEMPLATES.items())
+    jds = [clean(description) for _, description in roles]
+    filler = "experienced professional team player delivered projects on time worked with stakeholders".split()
+
+    def skills_of(description: str) -> List[str]:
+        return re.findall(r"[A-Za-z][A-Za-z0-9.+#-]*", description.split("Responsibilities:")[0])
+
+    resumes, expected = [], []
+    for index, (_, description) in enumerate(roles):
+        skills = skills_of(description)
+        for _ in range(resumes_per_role):
+            # Mostly the target role's skills, plus noise from another role
+            other = skills_of(rng.choice([d for i, (_, d) in enumerate(roles) if i != index]))
+            words = (
+                rng.sample(skills, k=max(1, len(skills) // 5))
+                + rng.sample(other, k=max(1, len(other) // 10))
+                + rng.choices(filler, k=40)
+            )
+            rng.shuffle(words)
+            resumes.append(clean(" ".join(words)))
+            expected.append(index)
+
+    start = time.perf_counter()
+    report = compare_strategies(resumes, jds, expected)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(resumes)} resumes x {len(jds)} JDs scored in {elapsed * 1000:.0f} ms (all signals)")
+    for name, metrics in report.items():
+        print(f"{name:>15}: top1={metrics['top1']:.3f} mrr={metrics['mrr']:.3f} margin={metrics['margin']:.2f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,151 @@
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, Tuple
+
+# Section Configuration
+SECTION_HEADINGS = {
+    "summary": ["summary", "profile", "professional summary", "objective", "about me"],
+    "skills": ["skills", "technical skills", "core competencies", "technologies", "tech stack", "tools"],
+    "experience": ["experience", "work experience", "professional experience", "employment history", "work history"],
+    "education": ["education", "academic background", "qualifications", "certifications"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+}
+SECTION_WEIGHTS = {
+    "skills": 0.35,
+    "experience": 0.3,
+    "projects": 0.2,
+    "education": 0.1,
+    "summary": 0.05,
+    "other": 0.05,
+}
+
+# Headings that double as labels inside entries ("Tech Stack: React, Node"
+# under a job). With a colon they only start a section near the top of the
+# resume; elsewhere only the bare heading on its own line does.
+LABEL_HEADINGS = {"tools", "technologies", "tech stack"}
+
+_HEADING_TO_SECTION = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+_HEADINGS = "|".join(sorted((re.escape(h) for h in _HEADING_TO_SECTION), key=len, reverse=True))
+# A heading starts its line and is either alone on it or followed by a colon
+# ("Skills: Python, SQL"); labels like "Technologies:" mid-line are content
+_HEADING_PATTERN = re.compile(
+    rf"(?im)^[ \t]*({_HEADINGS})[ \t]*(:?)[ \t]*$|^[ \t]*({_HEADINGS})[ \t]*:"
+)
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """
+    Splits raw resume text into sections by their headings
+
+    Text before the first heading goes to "other", as does everything
+    when no heading is found. See LABEL_HEADINGS for headings that are
+    ignored inside entries.
+
+    Args:
+        text: Raw extracted resume text (line breaks preserved)
+
+    Returns:
+        Mapping of section name to its raw text
+    """
+    sections: Dict[str, list] = {}
+    current = "other"
+    position = 0
+
+    for match in _HEADING_PATTERN.finditer(text):
+        heading = (match.group(1) or match.group(3)).lower()
+        has_colon = match.group(3) is not None or match.group(2) == ":"
+        if has_colon and heading in LABEL_HEADINGS and current not in ("other", "summary"):
+            continue  # A label inside an entry, part of the current section
+
+        sections.setdefault(current, []).append(text[position:match.start()])
+        current = _HEADING_TO_SECTION[heading]
+        position = match.end()
+    sections.setdefault(current, []).append(text[position:])
+
+    return {
+        name: " ".join(part.strip() for part in parts if part.strip())
+        for name, parts in sections.items()
+        if any(part.strip() for part in parts)
+    }
+
+
+def token_vector(clean_text: str, stop_words: Iterable[str]) -> Dict[str, int]:
+    """
+    Term-frequency vector of preprocessed text, without stop words
+
+    Args:
+        clean_text: Preprocessed text
+        stop_words: Words to drop
+
+    Returns:
+        Mapping of term to count
+    """
+    stop_words = set(stop_words)
+    return dict(Counter(token for token in clean_text.split() if token not in stop_words and len(token) > 1))
+
+
+def parse_resume(text: str, preprocess: Callable[[str], str], stop_words: Iterable[str]) -> dict:
+    """
+    Builds the compact structured form of a resume
+
+    Args:
+        text: Raw extracted resume text
+        preprocess: Text normalizer (ResumeAnalyzer.preprocess_text)
+        stop_words: Words excluded from token vectors
+
+    Returns:
+        JSON-serializable dict with per-section cleaned text and token vectors
+    """
+    sections = {}
+    for name, section_text in split_sections(text).items():
+        clean = preprocess(section_text)
+        sections[name] = {
+            "text": clean,
+            "vector": token_vector(clean, stop_words)
+        }
+    return {"sections": sections}
+
+
+def _cosine(a: Dict[str, int], b: Dict[str, int]) -> float:
+    """Cosine similarity of two sparse vectors with sublinear (log) term frequency"""
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(math.log1p(count) * math.log1p(b[term]) for term, count in a.items() if term in b)
+    norm_a = math.sqrt(sum(math.log1p(count) ** 2 for count in a.values()))
+    norm_b = math.sqrt(sum(math.log1p(count) ** 2 for count in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+def score_sections(parsed: dict, jd_vector: Dict[str, int], weights: Dict[str, float] = SECTION_WEIGHTS) -> Tuple[float, Dict[str, float]]:
+    """
+    Scores each resume section against a job description
+
+    Section vectors are reused as-is, so scoring one parsed resume against
+    many job descriptions never re-reads the raw text.
+
+    Args:
+        parsed: Output of parse_resume
+        jd_vector: Token vector of the preprocessed job description
+        weights: Relative weight per section; renormalized over the sections present
+
+    Returns:
+        Tuple of (weighted score, per-section scores), all in [0, 100]
+    """
+    section_scores = {
+        name: round(_cosine(section["vector"], jd_vector) * 100, 2)
+        for name, section in parsed["sections"].items()
+    }
+
+    total_weight = sum(weights.get(name, 0) for name in section_scores)
+    if total_weight <= 0:
+        return 0.0, section_scores
+
+    weighted = sum(score * weights.get(name, 0) for name, score in section_scores.items()) / total_weight
+    return round(weighted, 2), section_scores
@@ -16,11 +16,11 @@ function App() {
 
   const handleFileChange = (e) => {
     const selectedFile = e.target.files[0];
-    if (selectedFile && selectedFile.type === 'application/pdf') {
+    if (selectedFile && /\.(pdf|docx|txt)$/i.test(selectedFile.name)) {
       setFile(selectedFile);
       setError('');
     } else {
-      setError('Please select a valid PDF file');
+      setError('Please select a PDF, DOCX or TXT file');
       setFile(null);
     }
   };
@@ -166,12 +166,12 @@ function App() {
           <div className="glass-effect rounded-2xl p-6">
             <label className="flex items-center gap-2 text-lg font-semibold text-gray-800 mb-3">
               <Upload className="w-5 h-5 text-blue-600" />
-              Upload Resume (PDF)
+              Upload Resume (PDF, DOCX, TXT)
             </label>
             <div className="relative">
               <input
                 type="file"
-                accept=".pdf"
+                accept=".pdf,.docx,.txt"
                 onChange={handleFileChange}
                 className="hidden"
                 id="file-upload"
@@ -182,7 +182,7 @@ function App() {
               >
                 <Upload className="w-12 h-12 text-gray-400 mb-2" />
                 <span className="text-gray-600 font-medium">
-                  {file ? file.name : 'Click to upload PDF'}
+                  {file ? file.name : 'Click to upload resume'}
                 </span>
                 <span className="text-sm text-gray-400 mt-1">Max size: 5MB</span>
               </label>
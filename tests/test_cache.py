@@ -0,0 +1,185 @@
+import threading
+import multiprocessing
+
+import pytest
+
+from backend import cache as cache_module
+from backend.cache import KeyValueCache, MemoryLRUCache, SQLiteCache, create_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeKeyValueClient:
+    """Subset of the redis-py client used by KeyValueCache"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, pattern):
+        return [key for key in list(self.data) if key.startswith(pattern.rstrip("*"))]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "time", fake)
+    return fake
+
+
+def _write_from_other_process(path: str):
+    other = SQLiteCache(path)
+    assert other.get("parent") == {"written": "by parent"}
+    other.set("child", [1, 2, 3])
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = MemoryLRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_ttl_expiry(clock):
+    cache = MemoryLRUCache(default_ttl=60)
+    cache.set("short", "value", ttl=10)
+    cache.set("default", "value")
+    cache.set("forever", "value", ttl=0)
+
+    clock.now += 11
+    assert cache.get("short") is None
+    assert cache.get("default") == "value"
+    clock.now += 60
+    assert cache.get("default") is None
+    assert cache.get("forever") == "value"
+    assert cache.stats()["expirations"] == 2
+
+
+def test_stats_counts_hits_and_misses():
+    cache = MemoryLRUCache()
+    cache.set("key", {"score": 1})
+    cache.get("key")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"], stats["size"]) == (1, 1, 0.5, 1)
+
+
+def test_sqlite_round_trip_and_ttl(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), default_ttl=60)
+    cache.set("result", {"match_score": 72.5, "keywords": ["python"]})
+    assert cache.get("result") == {"match_score": 72.5, "keywords": ["python"]}
+
+    clock.now += 61
+    assert cache.get("result") is None
+    assert cache.size() == 0
+    assert cache.stats()["expirations"] == 1
+
+
+def test_sqlite_evicts_least_recently_accessed(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2, evict_interval=1)
+    cache.set("a", 1)
+    clock.now += 1
+    cache.set("b", 2)
+    clock.now += 1
+    assert cache.get("a") == 1
+    clock.now += 1
+    cache.set("c", 3)
+
+    assert cache.size() == 2
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_shared_between_processes(tmp_path):
+    path = str(tmp_path / "shared.db")
+    cache = SQLiteCache(path)
+    cache.set("parent", {"written": "by parent"})
+
+    process = multiprocessing.get_context("spawn").Process(target=_write_from_other_process, args=(path,))
+    process.start()
+    process.join(timeout=60)
+
+    assert process.exitcode == 0
+    assert cache.get("child") == [1, 2, 3]
+
+
+def test_sqlite_counters_are_thread_safe(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.set("key", "value")
+
+    def lookups():
+        for _ in range(200):
+            cache.get("key")
+            cache.get("missing")
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (cache.hits, cache.misses) == (1600, 1600)
+
+
+def test_key_value_cache_uses_prefix():
+    client = FakeKeyValueClient()
+    cache = KeyValueCache(client, prefix="test:")
+    cache.set("a", {"x": 1})
+    client.data["other:b"] = "{}"
+
+    assert cache.get("a") == {"x": 1}
+    assert cache.size() == 1
+    cache.clear()
+    assert list(client.data) == ["other:b"]
+
+
+def test_create_cache_urls(tmp_path):
+    assert isinstance(create_cache("memory://"), MemoryLRUCache)
+    assert isinstance(create_cache(f"sqlite:///{tmp_path}/c.db"), SQLiteCache)
+    with pytest.raises(ValueError):
+        create_cache("memcached://localhost")
+
+
+def test_analysis_cache_key_depends_on_scoring_config(monkeypatch):
+    from backend.analyzer import ResumeAnalyzer
+    from backend.scoring import ScoringEngine
+
+    resume = ("Python developer with FastAPI, Docker and PostgreSQL experience building billing services. " * 3).encode()
+    jd = "Backend engineer with Python, Kubernetes and Docker experience."
+    shared = MemoryLRUCache()
+
+    def analyzer_with(weights):
+        monkeypatch.setattr(
+            "backend.analyzer.ScoringEngine",
+            lambda stop_words: ScoringEngine(strategy="blend", weights=weights, stop_words=stop_words)
+        )
+        return ResumeAnalyzer(cache=shared)
+
+    cosine_heavy = analyzer_with({"cosine": 1.0, "bm25": 0.0})
+    bm25_heavy = analyzer_with({"cosine": 0.0, "bm25": 1.0})
+    assert cosine_heavy.config_fingerprint != bm25_heavy.config_fingerprint
+
+    first = cosine_heavy.analyze(resume, jd)
+    second = bm25_heavy.analyze(resume, jd)
+    assert first["match_score"] == first["score_breakdown"]["cosine"]
+    assert second["match_score"] == second["score_breakdown"]["bm25"]
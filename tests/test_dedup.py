@@ -0,0 +1,117 @@
+import pytest
+
+from backend.analyzer import ResumeAnalyzer
+from backend.cache import MemoryLRUCache
+from backend.dedup import MinHasher, NearDuplicateIndex
+
+RESUME = """Summary
+Backend engineer with six years of experience building billing and payments services.
+Skills
+Python, FastAPI, PostgreSQL, Redis, Kafka, REST APIs, unit testing, code review
+Experience
+Senior Engineer at Acme Corp, built a billing service handling two million requests per day,
+led a team of four engineers, introduced contract tests and cut incident count by half.
+Engineer at Initech, migrated reporting jobs to Airflow and maintained the data warehouse.
+Owned the on-call rotation for the payments platform, wrote runbooks for every alert, automated
+database failover drills and reduced the mean time to recovery from hours to minutes. Designed the
+public invoicing API used by two hundred partner companies, including versioning, rate limiting and
+idempotency keys. Mentored junior engineers through design reviews and pair programming sessions.
+Projects
+Open source contributor to a Python library for currency conversion and rounding rules, maintainer
+of an internal load testing tool that replays production traffic against staging environments.
+Education
+BSc Computer Science, State University
+"""
+EDITED = RESUME.replace("Kafka, REST APIs", "Kafka, Docker, Kubernetes, REST APIs")
+JD = "Backend engineer with Python, FastAPI, Docker and Kubernetes experience building billing services."
+OTHER_JD = "Data engineer with Airflow, Spark and data warehouse experience for reporting pipelines."
+
+
+@pytest.fixture
+def analyzer():
+    return ResumeAnalyzer(cache=MemoryLRUCache())
+
+
+def test_minhash_similarity_tracks_jaccard():
+    hasher = MinHasher()
+    words = RESUME.lower().split()
+    assert MinHasher.similarity(hasher.signature(" ".join(words)), hasher.signature(" ".join(words))) == 1.0
+    assert MinHasher.similarity(hasher.signature(" ".join(words)), hasher.signature(" ".join(reversed(words)))) < 0.2
+
+
+def test_index_query_and_remove():
+    hasher = MinHasher()
+    index = NearDuplicateIndex(threshold=0.8, max_entries=2)
+    signature = hasher.signature(RESUME.lower())
+    index.add("a", signature, {"results": {}})
+
+    assert [key for key, _, _ in index.query(signature)] == ["a"]
+    index.remove("a")
+    assert index.query(signature) == []
+
+    for key in ("a", "b", "c"):
+        index.add(key, hasher.signature(f"{key} " + RESUME.lower()), {"results": {}})
+    assert list(index.entries) == ["b", "c"]  # Oldest entry evicted
+
+
+def test_edited_resume_is_flagged_but_scored_fresh(analyzer):
+    first = analyzer.analyze(RESUME.encode(), JD)
+    assert first["duplicate_of"] is None
+
+    edited = analyzer.analyze(EDITED.encode(), JD)
+    fresh = ResumeAnalyzer(cache=MemoryLRUCache()).analyze(EDITED.encode(), JD)
+
+    assert edited["duplicate_of"] is not None
+    assert edited["match_score"] == fresh["match_score"] != first["match_score"]
+    assert edited["missing_keywords"] == fresh["missing_keywords"]
+
+
+def test_reuse_requires_same_jd_terms(analyzer):
+    analyzer.reuse_duplicates = True
+    analyzer.reuse_threshold = 0.0  # Isolate the JD-term check from the similarity bar
+
+    first = analyzer.analyze(RESUME.encode(), JD)
+    edited = analyzer.analyze(EDITED.encode(), JD)
+    assert edited["duplicate_of"] is not None
+    assert edited["match_score"] != first["match_score"]
+
+    # Docker and Kubernetes are irrelevant to this JD, so the prior result stands in
+    analyzer.analyze(RESUME.encode(), OTHER_JD)
+    reused = analyzer.analyze(EDITED.encode(), OTHER_JD)
+    assert reused["duplicate_of"] is not None
+    assert reused["match_score"] == analyzer.analyze(RESUME.encode(), OTHER_JD)["match_score"]
+
+
+def test_find_duplicate_skips_own_file_and_respects_threshold(analyzer):
+    hasher = analyzer.duplicate_index.hasher
+    clean = analyzer.preprocess_text
+    signature = hasher.signature(clean(RESUME))
+    edited_signature = hasher.signature(clean(EDITED))
+    terms = analyzer.jd_term_fingerprint(clean(RESUME), clean(JD))
+    analyzer.remember_result("v1", signature, "jd", {"match_score": 42.0}, terms)
+
+    # Same file: its own result, never flagged
+    assert analyzer.find_duplicate(signature, "jd", "v1", terms) == (None, None, {"match_score": 42.0})
+
+    # Near-duplicate below the reuse threshold: flagged only
+    analyzer.reuse_threshold = 0.999
+    key, similarity, prior = analyzer.find_duplicate(edited_signature, "jd", "v2", terms)
+    assert key == "v1" and 0.9 <= similarity < 0.999 and prior is None
+
+    # Above the threshold with the same JD terms: reusable; other JD: not
+    analyzer.reuse_threshold = 0.9
+    assert analyzer.find_duplicate(edited_signature, "jd", "v2", terms)[2] == {"match_score": 42.0}
+    assert analyzer.find_duplicate(edited_signature, "other-jd", "v2", terms)[2] is None
+    assert analyzer.find_duplicate(edited_signature, "jd", "v2", "changed-terms")[2] is None
+
+
+def test_remember_result_keeps_latest_jds(analyzer):
+    signature = analyzer.duplicate_index.hasher.signature(analyzer.preprocess_text(RESUME))
+    result = {"match_score": 1.0}
+    for jd in ("a", "b", "c", "a"):
+        analyzer.remember_result("v1", signature, jd, result, "terms", max_jds=2)
+    result["match_score"] = 99.0  # Stored copies are not affected
+
+    results = analyzer.duplicate_index.entries["v1"][1]["results"]
+    assert list(results) == ["c", "a"]
+    assert results["a"] == {"result": {"match_score": 1.0}, "jd_terms": "terms"}
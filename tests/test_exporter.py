@@ -0,0 +1,100 @@
+import csv
+import gzip
+import json
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+
+from backend import exporter
+from backend.exporter import EXPORT_FIELDS, encode_csv, encode_ndjson, stream_export
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+def make_doc(index: int = 0) -> dict:
+    return {
+        "_id": ObjectId(),
+        "match_score": 72.5 + index,
+        "missing_keywords": ["docker", "aws"],
+        "matched_keywords": ["python"],
+        "summary": "Good match, with \"quotes\", commas\nand a newline",
+        "scoring_strategy": "blend",
+        "score_breakdown": {"cosine": 70.0, "bm25": 75.0},
+        "section_scores": None,
+        "resume_filename": "résumé.pdf",
+        "job_description": "Python engineer",
+        "timestamp": datetime(2024, 5, 1, 9, 30),
+        "internal": "not exported",
+    }
+
+
+def collect(docs, export_format: str, compress: bool = False) -> bytes:
+    async def run():
+        return [chunk async for chunk in stream_export(FakeCursor(docs), export_format, compress)]
+
+    chunks = asyncio.run(run())
+    assert all(chunks)
+    return b"".join(chunks)
+
+
+def test_encode_ndjson_normalizes_bson_values():
+    doc = make_doc()
+    row = json.loads(encode_ndjson(doc))
+
+    assert list(row) == EXPORT_FIELDS
+    assert row["_id"] == str(doc["_id"])
+    assert row["timestamp"] == "2024-05-01T09:30:00"
+    assert row["resume_filename"] == "résumé.pdf"
+    assert row["duplicate_of"] is None
+
+
+def test_encode_csv_header_and_flattened_cells():
+    header = next(csv.reader([encode_csv(None).decode()]))
+    assert header == EXPORT_FIELDS
+
+    [row] = list(csv.reader(encode_csv(make_doc()).decode().splitlines(keepends=True)))
+    values = dict(zip(EXPORT_FIELDS, row))
+    assert values["missing_keywords"] == "docker;aws"
+    assert json.loads(values["score_breakdown"]) == {"bm25": 75.0, "cosine": 70.0}
+    assert values["summary"] == "Good match, with \"quotes\", commas\nand a newline"
+    assert values["section_scores"] == ""
+
+
+def test_stream_ndjson_in_batches(monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_BATCH_SIZE", 2)
+    docs = [make_doc(i) for i in range(5)]
+
+    lines = collect(docs, "ndjson").decode().splitlines()
+    assert [json.loads(line)["_id"] for line in lines] == [str(doc["_id"]) for doc in docs]
+
+
+def test_stream_csv_starts_with_header():
+    rows = list(csv.reader(collect([make_doc(), make_doc(1)], "csv").decode().splitlines(keepends=True)))
+    assert rows[0] == EXPORT_FIELDS
+    assert len(rows) == 3
+
+
+def test_gzip_round_trip(monkeypatch):
+    monkeypatch.setattr(exporter, "EXPORT_BATCH_SIZE", 3)
+    docs = [make_doc(i) for i in range(10)]
+
+    plain = collect(docs, "ndjson")
+    compressed = collect(docs, "ndjson", compress=True)
+    assert compressed[:2] == b"\x1f\x8b"
+    assert gzip.decompress(compressed) == plain
+
+
+def test_empty_export():
+    assert collect([], "ndjson") == b""
+    assert gzip.decompress(collect([], "csv", compress=True)) == encode_csv(None)
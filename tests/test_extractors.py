@@ -0,0 +1,146 @@
+import io
+import time
+import zipfile
+import threading
+
+import pytest
+
+from backend.analyzer import ResumeAnalyzer
+from backend.cache import MemoryLRUCache
+from backend.extractors import DocxExtractor, Extractor, ExtractorBusyError, ExtractorRegistry, TextExtractor, TXT
+from backend.profiler import RequestProfiler, SamplingProfiler, current_profiler
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def make_docx(body: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+    return buffer.getvalue()
+
+
+class SlowExtractor(Extractor):
+    name = "slow"
+
+    def __init__(self, release: threading.Event):
+        self.release = release
+
+    def extract(self, data: bytes) -> str:
+        self.release.wait()
+        return "too late"
+
+
+def test_docx_tabs_and_breaks_become_whitespace():
+    docx = make_docx(
+        "<w:p><w:r><w:t>Python</w:t><w:tab/><w:t>Docker</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r></w:p>"
+    )
+    assert DocxExtractor().extract(docx) == "Python\tDocker\nLine one\nLine two"
+
+
+def test_docx_rejects_oversized_document_xml():
+    docx = make_docx("<w:p><w:r><w:t>" + "a" * 100_000 + "</w:t></w:r></w:p>")
+    assert len(docx) < 10_000  # Compresses well, like a zip bomb
+    with pytest.raises(ValueError, match="limit"):
+        DocxExtractor(max_xml_bytes=50_000).extract(docx)
+
+
+def test_timed_out_backend_does_not_block_later_documents():
+    release = threading.Event()
+    registry = ExtractorRegistry(timeout=0.2, max_abandoned=10)
+    registry.register(TXT, SlowExtractor(release))
+    registry.register(TXT, TextExtractor())
+
+    try:
+        # More hung backends than any fixed pool would have workers
+        for _ in range(6):
+            start = time.perf_counter()
+            assert registry.extract(b"plain text resume") == "plain text resume"
+            assert time.perf_counter() - start < 1.0
+    finally:
+        release.set()
+
+
+def test_timeout_error_is_reported():
+    release = threading.Event()
+    registry = ExtractorRegistry(timeout=0.05)
+    registry.register(TXT, SlowExtractor(release))
+    try:
+        with pytest.raises(ValueError, match="slow: timed out"):
+            registry.extract(b"plain text resume")
+    finally:
+        release.set()
+
+
+def test_abandoned_backends_are_capped():
+    release = threading.Event()
+    registry = ExtractorRegistry(timeout=0.05, max_abandoned=2)
+    registry.register(TXT, SlowExtractor(release))
+    registry.register(TXT, TextExtractor())
+
+    try:
+        assert registry.extract(b"plain text resume") == "plain text resume"
+        assert registry.abandoned() == 1
+        # The second hung backend reaches the cap, so not even the fallback starts
+        with pytest.raises(ExtractorBusyError):
+            registry.extract(b"plain text resume")
+        assert registry.abandoned() == 2
+        with pytest.raises(ExtractorBusyError):
+            registry.extract(b"plain text resume")
+    finally:
+        release.set()
+
+    deadline = time.perf_counter() + 5
+    while registry.abandoned() and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert registry.abandoned() == 0
+    assert registry.extract(b"plain text resume") == "too late"  # Released backend answers again
+
+
+def test_failed_extraction_is_cached():
+    class FailingExtractor(Extractor):
+        name = "failing"
+        calls = 0
+
+        def extract(self, data: bytes) -> str:
+            FailingExtractor.calls += 1
+            raise RuntimeError("corrupt document")
+
+    registry = ExtractorRegistry(timeout=5)
+    registry.register(TXT, FailingExtractor())
+    analyzer = ResumeAnalyzer(cache=MemoryLRUCache(), extractors=registry)
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="failing: corrupt document"):
+            analyzer.extract_text(b"plain text resume")
+    assert FailingExtractor.calls == 1
+
+
+def test_profiler_samples_extraction_thread(tmp_path):
+    class BusyExtractor(Extractor):
+        name = "busy"
+
+        def extract(self, data: bytes) -> str:
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pass
+            return "done"
+
+    registry = ExtractorRegistry(timeout=5)
+    registry.register(TXT, BusyExtractor())
+    profiler = RequestProfiler(output_dir=str(tmp_path), interval_ms=1)
+
+    captured = []
+    with profiler.session("req", b"data", force=True):
+        captured.append(current_profiler())
+        registry.extract(b"plain text resume")
+    assert current_profiler() is None
+
+    sampler = captured[0]
+    assert isinstance(sampler, SamplingProfiler)
+    busy = [stack for stack in sampler.samples if stack[-1].startswith("extract (test_extractors.py")]
+    assert busy, "extraction thread was not sampled"
+    # Helper stacks hang below the registry call that waited on them
+    assert all(any(label.startswith("_run (extractors.py") for label in stack) for stack in busy)
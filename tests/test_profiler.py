@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import threading
+
+from backend import profiler as profiler_module
+from backend.profiler import RequestProfiler, SamplingProfiler
+
+
+def busy(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def profile_files(directory) -> list:
+    return sorted(os.listdir(directory))
+
+
+def test_header_requires_token(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), token="secret", sample_rate=0)
+    assert profiler.should_profile("secret")
+    assert profiler.should_profile(" secret ")
+    assert not profiler.should_profile("1")
+    assert not profiler.should_profile(None)
+
+    assert not RequestProfiler(output_dir=str(tmp_path), token="").should_profile("")
+
+
+def test_session_is_noop_without_threshold(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), slow_ms=0)
+    with profiler.session("req", b"data"):
+        busy(0.02)
+    assert profile_files(tmp_path) == []
+
+
+def test_forced_session_writes_collapsed_profile(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), interval_ms=1)
+    with profiler.session("req/1", b"data", force=True):
+        busy(0.05)
+
+    [name] = profile_files(tmp_path)
+    assert "_req_1_" in name and name.endswith(".collapsed")
+    lines = (tmp_path / name).read_text().splitlines()
+    assert any("busy (test_profiler.py" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_speedscope_output(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), output_format="speedscope", interval_ms=1)
+    with profiler.session("req", b"data", force=True):
+        busy(0.03)
+
+    [name] = profile_files(tmp_path)
+    document = json.loads((tmp_path / name).read_text())
+    profile = document["profiles"][0]
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    assert all(index < len(document["shared"]["frames"]) for stack in profile["samples"] for index in stack)
+
+
+def test_slow_threshold_and_coarse_interval(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), slow_ms=30, interval_ms=1, slow_interval_ms=10)
+
+    with profiler.session("fast", b"data"):
+        pass
+    assert profile_files(tmp_path) == []
+
+    captured = []
+    with profiler.session("slow", b"data"):
+        captured.append(profiler_module.current_profiler())
+        busy(0.1)
+    assert len(profile_files(tmp_path)) == 1
+    assert captured[0].interval == 0.01
+    assert sum(captured[0].samples.values()) <= 12
+
+
+def test_concurrent_sessions_share_one_sampler_thread(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), interval_ms=1)
+    started = threading.Barrier(3)
+
+    def request(request_id: str):
+        with profiler.session(request_id, b"data", force=True):
+            started.wait()
+            busy(0.05)
+
+    workers = [threading.Thread(target=request, args=(f"req{i}",)) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(profile_files(tmp_path)) == 3
+    assert [t.name for t in threading.enumerate()].count("sampling-profiler") == 1
+    assert profiler_module._sampler_thread.active == 0
+
+
+def test_max_files_prunes_oldest(tmp_path):
+    profiler = RequestProfiler(output_dir=str(tmp_path), max_files=2, interval_ms=1)
+    for i in range(4):
+        with profiler.session(f"req{i}", b"data", force=True):
+            busy(0.005)
+        path = tmp_path / profile_files(tmp_path)[-1]
+        os.utime(path, (1000 + i, 1000 + i))  # Distinct mtimes within one second
+
+    names = profile_files(tmp_path)
+    assert len(names) == 2
+    assert any("_req3_" in name for name in names)
+
+
+def test_trim_keeps_most_frequent_stacks():
+    sampler = SamplingProfiler(thread_id=0)
+    sampler.samples.update({("main", "hot"): 50, ("main", "warm"): 5, ("main", "cold" * 100): 1})
+    sampler.trim(max_bytes=40)
+    assert set(sampler.samples) == {("main", "hot"), ("main", "warm")}
@@ -0,0 +1,218 @@
+import os
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, ConnectionFailure
+
+from backend import resilience
+from backend.resilience import CircuitBreaker, DiskSpool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResult:
+    def __init__(self, inserted_ids):
+        self.inserted_ids = inserted_ids
+
+
+class FakeCollection:
+    """Mimics insert_many(ordered=False): inserts new ids, reports duplicates as code 11000"""
+
+    def __init__(self, fail_after=None):
+        self.docs = {}
+        self.calls = 0
+        self.fail_after = fail_after
+
+    async def insert_many(self, docs, ordered=True):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise ConnectionFailure("connection refused")
+
+        inserted, errors = [], []
+        for index, doc in enumerate(docs):
+            if doc["_id"] in self.docs:
+                errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+            else:
+                self.docs[doc["_id"]] = doc
+                inserted.append(doc["_id"])
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+        return FakeResult(inserted)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+def make_doc(score=50.0):
+    return {"_id": ObjectId(), "match_score": score, "timestamp": datetime(2024, 1, 1, 12, 30)}
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_allows_single_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.now += 29
+    assert not breaker.allow()
+
+    clock.now += 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one trial until it reports back
+
+
+def test_breaker_trial_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_breaker_trial_failure_reopens_for_full_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_spool_append_and_replay(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    docs = [make_doc(score) for score in (10.0, 20.0, 30.0)]
+    for doc in docs:
+        spool.append(doc)
+    assert spool.size() == 3
+
+    collection = FakeCollection()
+    assert asyncio.run(spool.replay(collection, batch_size=2)) == 3
+    assert set(collection.docs) == {doc["_id"] for doc in docs}
+    assert collection.docs[docs[0]["_id"]]["timestamp"] == datetime(2024, 1, 1, 12, 30)
+    assert spool.size() == 0
+    assert os.listdir(tmp_path) == []
+
+    assert asyncio.run(spool.replay(collection)) == 0
+
+
+def test_spool_replay_is_idempotent(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    docs = [make_doc() for _ in range(4)]
+    for doc in docs:
+        spool.append(doc)
+
+    collection = FakeCollection()
+    collection.docs[docs[1]["_id"]] = docs[1]  # Stored by an earlier, interrupted replay
+
+    assert asyncio.run(spool.replay(collection)) == 3
+    assert len(collection.docs) == 4
+    assert spool.size() == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_failed_replay_is_retried(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    docs = [make_doc() for _ in range(4)]
+    for doc in docs:
+        spool.append(doc)
+
+    collection = FakeCollection(fail_after=1)
+    with pytest.raises(ConnectionFailure):
+        asyncio.run(spool.replay(collection, batch_size=2))
+    assert len(collection.docs) == 2
+    assert spool.size() == 4
+
+    # The file stays claimed by this worker while new documents go to a fresh one
+    extra = make_doc()
+    spool.append(extra)
+    assert len(os.listdir(tmp_path)) == 2
+
+    collection.fail_after = None
+    assert asyncio.run(spool.replay(collection, batch_size=2)) == 3
+    assert set(collection.docs) == {doc["_id"] for doc in docs + [extra]}
+    assert spool.size() == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_replays_only_stale_files_of_other_workers(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    fresh = tmp_path / "spool-1.ndjson"
+    stale = tmp_path / "spool-2.ndjson"
+    fresh.write_text("")
+    stale.write_text("")
+    old = os.path.getmtime(stale) - resilience.SPOOL_STALE_SECONDS - 1
+    os.utime(stale, (old, old))
+
+    assert spool.pending_files() == [str(stale)]
+
+
+def test_spool_skips_files_removed_during_scan(tmp_path, monkeypatch):
+    spool = DiskSpool(str(tmp_path))
+    (tmp_path / "spool-2.ndjson").write_text("")
+
+    def vanished(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(resilience.os.path, "getmtime", vanished)
+    assert spool.pending_files() == []
+    assert asyncio.run(spool.replay(FakeCollection())) == 0
+
+
+def test_spool_truncated_record_does_not_block_replay(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    docs = [make_doc(score) for score in (10.0, 20.0)]
+    spool.append(docs[0])
+    with open(spool.path, "a", encoding="utf-8") as f:
+        f.write('{"_id": {"$oid": "65f0')  # Crash in the middle of an append
+    spool.append(docs[1])
+
+    # Another worker's file replayed after this one must drain too
+    other = make_doc(30.0)
+    other_path = tmp_path / "spool-99999.ndjson"
+    other_path.write_text(resilience.json_util.dumps(other) + "\n")
+    old = os.path.getmtime(other_path) - resilience.SPOOL_STALE_SECONDS - 1
+    os.utime(other_path, (old, old))
+
+    collection = FakeCollection()
+    assert asyncio.run(spool.replay(collection)) == 3
+    assert set(collection.docs) == {doc["_id"] for doc in docs + [other]}
+
+    corrupt = tmp_path / f"spool-{os.getpid()}.corrupt"
+    assert os.listdir(tmp_path) == [corrupt.name]
+    assert corrupt.read_text() == '{"_id": {"$oid": "65f0\n'
+    assert spool.size() == 0
+    assert asyncio.run(spool.replay(collection)) == 0
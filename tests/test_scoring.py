@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from backend.scoring import (
+    BM25Strategy,
+    CosineTfidfStrategy,
+    ScoringEngine,
+    SkillCoverageStrategy,
+    parse_weights,
+    template_skill_terms,
+)
+
+JD = "senior backend engineer python kubeflow docker responsibilities include working with the team years of experience"
+RESUMES = [
+    "python kubeflow docker engineer",
+    "python docker engineer team years experience",
+    "gardening cooking travel",
+]
+
+
+@pytest.mark.parametrize("strategy", [CosineTfidfStrategy(), BM25Strategy(), SkillCoverageStrategy()])
+def test_score_matrix_shape_and_range(strategy):
+    jds = [JD, "frontend developer react typescript css"]
+    scores = strategy.score_matrix(RESUMES, jds)
+
+    assert scores.shape == (3, 2)
+    assert np.all((scores >= 0) & (scores <= 100))
+    assert np.all(scores[2] == 0)  # Nothing in common
+    assert scores[0, 0] > scores[0, 1]
+
+
+def test_cosine_identical_text_scores_100():
+    assert CosineTfidfStrategy().score_matrix([JD], [JD])[0, 0] == pytest.approx(100)
+
+
+def test_bm25_weights_rare_terms_with_a_single_jd():
+    bm25 = BM25Strategy()
+    rare = bm25.score_matrix(["kubeflow"], [JD])[0, 0]
+    common = bm25.score_matrix(["experience"], [JD])[0, 0]
+    assert rare > 2 * common
+
+
+def test_bm25_idf_uses_background_corpus():
+    # Without a background every term of a single JD has df == 1 and the same IDF
+    flat = BM25Strategy(background=[])
+    assert flat.score_matrix(["kubeflow"], [JD])[0, 0] == pytest.approx(flat.score_matrix(["experience"], [JD])[0, 0])
+
+    background = ["we value experience and years of work"] * 5
+    weighted = BM25Strategy(background=background)
+    assert weighted.score_matrix(["kubeflow"], [JD])[0, 0] > weighted.score_matrix(["experience"], [JD])[0, 0]
+
+
+def test_bm25_full_coverage_caps_at_100():
+    assert BM25Strategy().score_matrix([JD + " " + JD], [JD])[0, 0] == pytest.approx(100)
+
+
+def test_skill_coverage_ignores_generic_words():
+    coverage = SkillCoverageStrategy()
+    generic, skilled = coverage.score_matrix(
+        ["responsibilities include working with the team years of experience", "python kubeflow docker"],
+        [JD]
+    )[:, 0]
+    assert generic == 0
+    assert skilled == pytest.approx(100)
+
+
+def test_skill_coverage_falls_back_to_all_terms_without_known_skills():
+    coverage = SkillCoverageStrategy(skill_terms={"python"})
+    scores = coverage.score_matrix(["gardening roses"], ["gardening roses pruning tulips"])
+    assert scores[0, 0] == pytest.approx(50)
+
+
+def test_template_skill_terms_drop_category_labels():
+    terms = template_skill_terms()
+    assert {"python", "docker", "kubernetes", "react"} <= terms
+    assert "frontend" not in terms and "responsibilities" not in terms
+
+
+def test_blend_is_weighted_average():
+    engine = ScoringEngine(strategy="blend", weights={"cosine": 3, "bm25": 1})
+    signals = engine.score_all(RESUMES, [JD])
+    expected = (signals["cosine"] * 3 + signals["bm25"]) / 4
+    assert np.allclose(signals["blend"], expected)
+
+
+def test_parse_weights():
+    assert parse_weights("cosine:0.5, bm25:0.5,") == {"cosine": 0.5, "bm25": 0.5}
+    with pytest.raises(ValueError):
+        parse_weights("tfidf:1")
+    with pytest.raises(ValueError):
+        ScoringEngine(strategy="tfidf")
@@ -0,0 +1,150 @@
+import numpy as np
+
+from backend.scoring import ScoringEngine, parse_weights
+from backend.sections import parse_resume, split_sections, token_vector
+
+
+def clean(text: str) -> str:
+    return " ".join(text.lower().replace(",", " ").replace(".", " ").split())
+
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 0100
+
+PROFESSIONAL SUMMARY
+Backend engineer with six years of experience building APIs.
+
+Technical Skills
+Python, FastAPI, PostgreSQL, Docker, Kubernetes
+
+Work Experience
+Senior Engineer, Acme Corp (2020 - present)
+• Built a billing service handling 2M requests per day. Technologies: Python, Kafka, Redis
+• Led a team of four engineers
+
+Engineer, Initech (2017 - 2020)
+- Migrated the monolith to microservices (tools: Docker, Jenkins)
+
+Education
+B.Sc. Computer Science, State University
+
+Projects
+Resume Analyzer - FastAPI, React, MongoDB
+"""
+
+
+def test_splits_realistic_resume():
+    sections = split_sections(RESUME)
+
+    assert set(sections) == {"other", "summary", "skills", "experience", "education", "projects"}
+    assert sections["other"].startswith("Jane Doe")
+    assert sections["skills"] == "Python, FastAPI, PostgreSQL, Docker, Kubernetes"
+    assert "Technologies: Python, Kafka, Redis" in sections["experience"]
+    assert "tools: Docker, Jenkins" in sections["experience"]
+    assert "Initech" in sections["experience"]
+    assert sections["education"] == "B.Sc. Computer Science, State University"
+
+
+def test_inline_colon_headings_at_line_start():
+    text = (
+        "Summary: Data engineer focused on streaming pipelines.\n"
+        "Skills: Spark, Airflow, SQL\n"
+        "Experience:\n"
+        "Data Engineer at Globex, built the skills matrix and work experience portal.\n"
+    )
+    sections = split_sections(text)
+
+    assert sections == {
+        "summary": "Data engineer focused on streaming pipelines.",
+        "skills": "Spark, Airflow, SQL",
+        "experience": "Data Engineer at Globex, built the skills matrix and work experience portal.",
+    }
+
+
+def test_heading_words_inside_sentences_are_content():
+    text = (
+        "Experience\n"
+        "Improved onboarding experience for new users; Tools: Figma and Jira.\n"
+        "Mentored interns on education and projects planning.\n"
+    )
+    sections = split_sections(text)
+
+    assert list(sections) == ["experience"]
+    assert "Tools: Figma and Jira." in sections["experience"]
+
+
+def test_label_at_line_start_inside_entry_stays_in_section():
+    text = "Experience\nAcme Corp\nBuilt billing service\nTech Stack: React, Node\nLed team of 4\nEducation\nBSc"
+    sections = split_sections(text)
+
+    assert sections == {
+        "experience": "Acme Corp\nBuilt billing service\nTech Stack: React, Node\nLed team of 4",
+        "education": "BSc",
+    }
+
+
+def test_labels_inside_projects_and_skills():
+    text = (
+        "Skills\n"
+        "Languages: Python, Go\n"
+        "Tools: Docker, Terraform\n"
+        "Projects\n"
+        "Resume Analyzer\n"
+        "Technologies:\n"
+        "FastAPI, React\n"
+    )
+    sections = split_sections(text)
+
+    assert sections == {
+        "skills": "Languages: Python, Go\nTools: Docker, Terraform",
+        "projects": "Resume Analyzer\nTechnologies:\nFastAPI, React",
+    }
+
+
+def test_label_headings_start_sections_at_the_top_or_when_bare():
+    text = (
+        "Summary: Backend engineer.\n"
+        "Technologies: Python, Kafka\n"
+        "Experience\n"
+        "Acme Corp, billing\n"
+        "Tech Stack\n"
+        "Kubernetes, Terraform\n"
+    )
+    sections = split_sections(text)
+
+    assert sections == {
+        "summary": "Backend engineer.",
+        "skills": "Python, Kafka Kubernetes, Terraform",
+        "experience": "Acme Corp, billing",
+    }
+
+
+def test_text_without_headings_goes_to_other():
+    text = "Python developer with Django and AWS experience, worked on projects for banks."
+    assert split_sections(text) == {"other": text}
+
+
+def test_sections_signal_is_selectable_and_blended():
+    parsed = parse_resume(RESUME, clean, {"and", "with", "of", "a", "the"})
+    resume = clean(RESUME)
+    jd = clean("Backend engineer with Python, FastAPI, Kafka and Kubernetes experience.")
+
+    engine = ScoringEngine(strategy="sections", weights=parse_weights("cosine:0.5,sections:0.5"))
+    score, breakdown, section_scores = engine.score(resume, jd, parsed)
+
+    assert score == breakdown["sections"] > 0
+    assert section_scores["skills"] > section_scores["education"]
+    assert np.isclose(breakdown["blend"], (breakdown["cosine"] + breakdown["sections"]) / 2, atol=0.01)
+
+
+def test_blend_without_parsed_resume_ignores_sections_weight():
+    engine = ScoringEngine(strategy="blend", weights=parse_weights("cosine:0.5,sections:0.5"))
+    score, breakdown, section_scores = engine.score("python fastapi kafka", "python kafka engineer")
+
+    assert "sections" not in breakdown
+    assert section_scores is None
+    assert score == breakdown["cosine"]
+
+
+def test_token_vector_drops_stop_words():
+    assert token_vector("python and python a sql", {"and"}) == {"python": 2, "sql": 1}